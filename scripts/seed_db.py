@@ -76,6 +76,7 @@ def seed_db(heavy=False, admin_only=False):
         ("Another Great Beer", "Simply amazing fantastic beer.", "Amazing.")
     ]
 
+    now = datetime.now(timezone.utc)
     for title, content, summary in base_articles:
         slug = slugify(title)
         if not Article.objects(slug=slug).first():
@@ -86,7 +87,7 @@ def seed_db(heavy=False, admin_only=False):
                 slug=slug,
                 is_published=True,
                 author=admin_user_obj,
-                publication_date=datetime.now(timezone.utc) - timedelta(days=random.randint(0, 10))
+                publication_date=now - timedelta(days=random.randint(0, 10))
             ).save()
             print(f"Added article: {slug}")
 
@@ -103,7 +104,7 @@ def seed_db(heavy=False, admin_only=False):
                 
             # Random date over the last 2 years
             random_days = random.randint(0, 730)
-            pub_date = datetime.now(timezone.utc) - timedelta(days=random_days)
+            pub_date = now - timedelta(days=random_days)
             
             content = generate_random_content(1000, 1500)
             summary = " ".join(content.split()[:20]) + "..."
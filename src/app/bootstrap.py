@@ -3,10 +3,10 @@ Bootstrap and runtime configuration helpers for the Flask app factory.
 """
 
 import os
+import random
 import time
 from pathlib import Path
 
-from dotenv import load_dotenv
 from flask import Flask
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from werkzeug.middleware.proxy_fix import ProxyFix
@@ -16,21 +16,27 @@ from src.utils.db_utils import check_db_connection
 from src.utils.logger import setup_logging
 
 
-def load_environment() -> None:
-    """Load environment variables from the local environment, .env, and config.env files."""
-    # Load config.env first so that .env can override its values (secrets vs defaults)
-    load_dotenv("config.env")
-    load_dotenv(".env")
+# Filesystem layout never changes between app instances; resolve it once.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+TEMPLATE_DIR = str(PROJECT_ROOT / "templates")
+STATIC_DIR = str(PROJECT_ROOT / "static")
+
+
+def _env_flag(name: str, default: str = "false") -> bool:
+    value = os.environ.get(name, default)
+    return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
 def create_flask_app(import_name: str) -> Flask:
     """Create the base Flask app with project-level static/template paths."""
-    project_root = Path(__file__).resolve().parent.parent.parent
-    return Flask(
+    app = Flask(
         import_name,
-        template_folder=str(project_root / "templates"),
-        static_folder=str(project_root / "static"),
+        template_folder=TEMPLATE_DIR,
+        static_folder=STATIC_DIR,
     )
+    # Clients never depend on key order, so skip sorting every JSON payload.
+    app.json.sort_keys = False
+    return app
 
 
 def configure_proxy_fix(app: Flask) -> None:
@@ -43,6 +49,9 @@ def configure_proxy_fix(app: Flask) -> None:
     proxy_x_proto = int(os.environ.get("PROXY_FIX_X_PROTO", "1"))
     proxy_x_host = int(os.environ.get("PROXY_FIX_X_HOST", "1"))
     proxy_x_prefix = int(os.environ.get("PROXY_FIX_X_PREFIX", "1"))
+    # Serving directly (no trusted proxy hops at all): skip the wrapper frame.
+    if not (proxy_x_for or proxy_x_proto or proxy_x_host or proxy_x_prefix):
+        return
     app.wsgi_app = ProxyFix(
         app.wsgi_app,
         x_for=proxy_x_for,
@@ -52,16 +61,27 @@ def configure_proxy_fix(app: Flask) -> None:
     )
 
 
+def configure_logging(app: Flask) -> None:
+    """Install logging first so every later factory step logs through it."""
+    setup_logging(app)
+    app.logger.info("Flask application starting up...")
+
+
 def configure_core_runtime(app: Flask) -> None:
     """
-    Configure secret key, logging, and database connectivity for runtime.
+    Configure secret key and database connectivity for runtime.
     """
-    app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY")
+    app.config["SECRET_KEY"] = app.config.get("SECRET_KEY") or os.environ.get(
+        "SECRET_KEY"
+    )
     if not app.config["SECRET_KEY"]:
         raise ValueError("A SECRET_KEY must be set in the environment variables.")
 
-    setup_logging(app)
-    app.logger.info("Flask application starting up...")
+    # Snapshot flags consulted on every page render/login into config so the
+    # request path reads a dict instead of re-parsing os.environ.
+    app.config["TURNSTILE_SITE_KEY"] = os.environ.get("TURNSTILE_SITE_KEY", "")
+    app.config["TURNSTILE_ENABLED"] = _env_flag("TURNSTILE_ENABLED", "true")
+    app.config["TURNSTILE_LOGIN_ENABLED"] = _env_flag("TURNSTILE_LOGIN_ENABLED")
 
     # Build MONGO_URI dynamically
     mongo_user = os.environ.get("MONGO_APP_USER", "webserver")
@@ -93,33 +113,55 @@ def configure_core_runtime(app: Flask) -> None:
         ),
         "connectTimeoutMS": int(os.environ.get("MONGO_CONNECT_TIMEOUT_MS", 10000)),
         "socketTimeoutMS": int(os.environ.get("MONGO_SOCKET_TIMEOUT_MS", 10000)),
+        # Each gunicorn worker serves a handful of threads, so a small warm
+        # pool avoids first-query handshakes without hoarding mongod memory.
+        "maxPoolSize": int(os.environ.get("MONGO_MAX_POOL_SIZE", 50)),
+        "minPoolSize": int(os.environ.get("MONGO_MIN_POOL_SIZE", 2)),
+        "maxIdleTimeMS": int(os.environ.get("MONGO_MAX_IDLE_TIME_MS", 300000)),
+        # Fail fast with a 503 instead of parking a thread when the pool is
+        # exhausted.
+        "waitQueueTimeoutMS": int(
+            os.environ.get("MONGO_WAIT_QUEUE_TIMEOUT_MS", 2500)
+        ),
+        # Defer the TCP handshake to first use instead of client construction.
+        "connect": False,
     }
 
     max_db_retries = 5
-    db_retry_delay_seconds = 5
+    db_retry_base_delay_seconds = 1
+    db_retry_max_delay_seconds = 30
     db_connected = False
 
     db.init_app(app)
     bcrypt.init_app(app)
 
     for i in range(max_db_retries):
+        # Exponential backoff with jitter so restarting workers do not all
+        # reconnect in lockstep.
+        delay = min(db_retry_max_delay_seconds, db_retry_base_delay_seconds * 2**i)
+        delay *= 0.5 + random.random()
         try:
             app.logger.info(
-                f"Attempting to connect to MongoDB (attempt {i + 1}/{max_db_retries})..."
+                "Attempting to connect to MongoDB (attempt %s/%s)...",
+                i + 1,
+                max_db_retries,
             )
             if check_db_connection(app):
                 db_connected = True
                 break
         except (ConnectionFailure, ServerSelectionTimeoutError) as err:
             app.logger.warning(
-                f"MongoDB connection failed: {err}. Retrying in {db_retry_delay_seconds} seconds..."
+                "MongoDB connection failed: %s. Retrying in %.1f seconds...",
+                err,
+                delay,
             )
         except Exception as err:
             app.logger.error(
-                f"An unexpected error occurred during database initialization: {err}"
+                "An unexpected error occurred during database initialization: %s", err
             )
             break
-        time.sleep(db_retry_delay_seconds)
+        if i < max_db_retries - 1:
+            time.sleep(delay)
 
     if not db_connected:
         app.logger.critical(
@@ -1,15 +1,22 @@
 """
 Centralized Flask error-handler registration.
+
+Handlers are module-level functions that log through a module logger, so
+repeated app creation only re-registers them instead of rebuilding closures.
 """
 
-from flask import jsonify, request
+import json
+import logging
+import os
+
+from flask import current_app, jsonify, request
 from flask_limiter.errors import RateLimitExceeded
 from mongoengine.errors import (
     NotUniqueError,
     ValidationError as MongoEngineValidationError,
 )
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from pydantic import ValidationError as PydanticValidationError
+from werkzeug.exceptions import Forbidden, HTTPException
 
 from src.exceptions import (
     APIException,
@@ -19,126 +26,218 @@ from src.exceptions import (
     ConflictException,
     InfrastructureException,  # Import the new base infrastructure exception
 )
+from src.utils.token_bucket import TokenBucket
 
+# Propagates to the root logger configured by setup_logging, like app.logger,
+# without resolving the current_app proxy on every error.
+logger = logging.getLogger(__name__)
 
-def register_error_handlers(app) -> None:
-    """Register all application error handlers."""
+# Bodies that never vary are serialized once at import. Handlers wrap them in
+# a fresh Response per request because after_request hooks mutate headers.
+_GENERIC_500 = APIException().to_dict()
+_GENERIC_500_BODY = json.dumps(_GENERIC_500, separators=(",", ":")) + "\n"
+_NOT_FOUND_BODY = (
+    json.dumps(
+        NotFoundException("The requested URL was not found on the server.").to_dict(),
+        separators=(",", ":"),
+    )
+    + "\n"
+)
+# Werkzeug 403s almost always carry the stock description.
+_FORBIDDEN_BODY = (
+    json.dumps(ForbiddenException(str(Forbidden())).to_dict(), separators=(",", ":"))
+    + "\n"
+)
 
-    @app.errorhandler(404)
-    def not_found_error(error):
-        app.logger.warning(f"404 Not Found: {error}")
-        response = NotFoundException(
-            "The requested URL was not found on the server."
-        ).to_dict()
-        return jsonify(response), 404
-
-    @app.errorhandler(RateLimitExceeded)
-    def ratelimit_handler(error):
-        app.logger.warning(
-            f"Rate Limit Exceeded for IP: {request.remote_addr} - {error.description}"
-        )
-        response = {
-            "error_code": "TOO_MANY_REQUESTS",
-            "message": "Too Many Requests",
-            "details": [
-                {"loc": [], "msg": error.description, "type": "rate_limit_exceeded"}
-            ],
-        }
-        return jsonify(response), 429
-
-    @app.errorhandler(PydanticValidationError)
-    def handle_pydantic_validation_error(error):
-        # Pydantic v2 .errors() returns exactly what we want: list of dicts with loc, msg, type
-        # We explicitly strip 'input' to avoid leaking passwords or PII in error responses
-        details = [
-            {k: v for k, v in err.items() if k != "input"} for err in error.errors()
-        ]
-        app.logger.warning(f"Pydantic Validation Error: {details}")
-        response = BadRequestException("Invalid data", details=details).to_dict()
-        return jsonify(response), 400
-
-    @app.errorhandler(MongoEngineValidationError)
-    def handle_mongoengine_validation_error(error):
-        details_list = []
-        if hasattr(error, "errors") and isinstance(error.errors, dict):
-            for field, err_obj in error.errors.items():
-                msg = getattr(err_obj, "message", str(err_obj))
-                details_list.append(
-                    {"loc": [field], "msg": msg, "type": "value_error.mongoengine"}
-                )
-        else:
+
+# Request bodies echoed into 400/422 logs are redacted and truncated.
+_SENSITIVE_LOG_KEYS = frozenset(
+    {"password", "current_password", "new_password", "token", "secret"}
+)
+_MAX_LOGGED_PAYLOAD_CHARS = 512
+
+# Traceback formatting is the expensive part of error logging. Allow a burst
+# of 10 full tracebacks, then roughly one per second; the rest log one line.
+_traceback_budget = TokenBucket(capacity=10, rate=1)
+
+# APIException 500s are raised deliberately and already carry their message;
+# their tracebacks are only logged when explicitly requested.
+_LOG_API_EXCEPTION_TRACEBACKS = os.environ.get(
+    "LOG_APIEXCEPTION_TRACEBACKS", "false"
+).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _static_json_response(body: str, status: int):
+    return current_app.response_class(body, status=status, mimetype="application/json")
+
+
+def not_found_error(error):
+    logger.warning("404 Not Found: %s", error)
+    return _static_json_response(_NOT_FOUND_BODY, 404)
+
+
+def ratelimit_handler(error):
+    logger.warning(
+        "Rate Limit Exceeded for IP: %s - %s", request.remote_addr, error.description
+    )
+    response = {
+        "error_code": "TOO_MANY_REQUESTS",
+        "message": "Too Many Requests",
+        "details": [
+            {"loc": [], "msg": error.description, "type": "rate_limit_exceeded"}
+        ],
+    }
+    return jsonify(response), 429
+
+
+def handle_pydantic_validation_error(error):
+    # Pydantic v2 .errors() returns exactly what we want: list of dicts with loc, msg, type
+    # We explicitly strip 'input' to avoid leaking passwords or PII in error responses
+    details = [
+        {k: v for k, v in err.items() if k != "input"} for err in error.errors()
+    ]
+    logger.warning("Pydantic Validation Error: %s", details)
+    response = BadRequestException("Invalid data", details=details).to_dict()
+    return jsonify(response), 400
+
+
+def handle_mongoengine_validation_error(error):
+    details_list = []
+    if hasattr(error, "errors") and isinstance(error.errors, dict):
+        for field, err_obj in error.errors.items():
+            msg = getattr(err_obj, "message", str(err_obj))
             details_list.append(
-                {"loc": [], "msg": str(error), "type": "value_error.mongoengine"}
+                {"loc": [field], "msg": msg, "type": "value_error.mongoengine"}
             )
-
-        app.logger.warning(f"MongoEngine Validation Error: {details_list}")
-        response = BadRequestException(
-            "Validation error", details=details_list
-        ).to_dict()
-        return jsonify(response), 400
-
-    @app.errorhandler(NotUniqueError)
-    def handle_not_unique_error(error):
-        app.logger.warning(f"Not Unique Error: {error}")
-        response = ConflictException(
-            "A resource with this identifier already exists."
-        ).to_dict()
-        return jsonify(response), 409
-
-    @app.errorhandler(APIException)
-    def handle_api_exception(error):
-        log_message = (
-            f"API Exception: {error.status_code} - {error.error_code} - {error.message}. "
-            f"Method: {request.method}, Path: {request.path}, IP: {request.remote_addr}"
-        )
-        if error.status_code in [400, 422] and request.is_json:
-            try:
-                # Redact sensitive fields from logs (shallow redact for common keys)
-                sensitive_keys = {
-                    "password",
-                    "current_password",
-                    "new_password",
-                    "token",
-                    "secret",
-                }
-                redacted_data = {
-                    k: ("[REDACTED]" if k.lower() in sensitive_keys else v)
-                    for k, v in request.json.items()
-                }
-                log_message += f", Request Data: {redacted_data}"
-            except Exception:
-                log_message += ", Request Data: <unparseable JSON>"
-
-        app.logger.warning(
-            log_message, exc_info=True if error.status_code == 500 else False
+    else:
+        details_list.append(
+            {"loc": [], "msg": str(error), "type": "value_error.mongoengine"}
         )
-        response = error.to_dict()
-        return jsonify(response), error.status_code
-
-    @app.errorhandler(InfrastructureException)
-    def handle_infrastructure_exception(error):
-        app.logger.error(
-            f"Infrastructure Exception: {error.status_code} - {error.error_code} - {error.message}. Method: {request.method}, Path: {request.path}, IP: {request.remote_addr}",
-            exc_info=True,
-        )
-        response = error.to_dict()
-        response["error_code"] = (
-            "SERVICE_UNAVAILABLE"  # Override to ensure consistency with API contract for 503
-        )
-        return jsonify(response), error.status_code
 
-    @app.errorhandler(Exception)
-    def internal_error(error):
-        log_message = (
-            f"Unhandled Exception: {error}. "
-            f"Method: {request.method}, Path: {request.path}, IP: {request.remote_addr}"
-        )
-        app.logger.error(log_message, exc_info=True)
-        response = APIException().to_dict()
-        return jsonify(response), APIException.status_code
-
-    @app.errorhandler(403)
-    def forbidden_error(error):
-        app.logger.warning(f"403 Forbidden: {error}")
-        response = ForbiddenException(str(error)).to_dict()
-        return jsonify(response), 403
+    logger.warning("MongoEngine Validation Error: %s", details_list)
+    response = BadRequestException(
+        "Validation error", details=details_list
+    ).to_dict()
+    return jsonify(response), 400
+
+
+def handle_not_unique_error(error):
+    logger.warning("Not Unique Error: %s", error)
+    response = ConflictException(
+        "A resource with this identifier already exists."
+    ).to_dict()
+    return jsonify(response), 409
+
+
+def handle_api_exception(error):
+    log_format = "API Exception: %s - %s - %s. Method: %s, Path: %s, IP: %s"
+    log_args = [
+        error.status_code,
+        error.error_code,
+        error.message,
+        request.method,
+        request.path,
+        request.remote_addr,
+    ]
+    # Only pay for payload redaction when the record will actually be emitted.
+    if (
+        error.status_code in (400, 422)
+        and request.is_json
+        and logger.isEnabledFor(logging.WARNING)
+    ):
+        # get_json reuses the body the view already parsed; silent avoids a
+        # second BadRequest for malformed payloads.
+        payload = request.get_json(silent=True)
+        if isinstance(payload, dict):
+            # Redact sensitive fields from logs (shallow redact for common keys)
+            redacted_data = {
+                k: ("[REDACTED]" if k.lower() in _SENSITIVE_LOG_KEYS else v)
+                for k, v in payload.items()
+            }
+            log_format += ", Request Data: %s"
+            log_args.append(repr(redacted_data)[:_MAX_LOGGED_PAYLOAD_CHARS])
+        else:
+            log_format += ", Request Data: <unparseable JSON>"
+
+    logger.warning(
+        log_format,
+        *log_args,
+        exc_info=(
+            _LOG_API_EXCEPTION_TRACEBACKS
+            and error.status_code == 500
+            and _traceback_budget.consume()
+        ),
+    )
+    response = error.to_dict()
+    return jsonify(response), error.status_code
+
+
+def handle_infrastructure_exception(error):
+    logger.error(
+        "Infrastructure Exception: %s - %s - %s. Method: %s, Path: %s, IP: %s",
+        error.status_code,
+        error.error_code,
+        error.message,
+        request.method,
+        request.path,
+        request.remote_addr,
+        exc_info=_traceback_budget.consume(),
+    )
+    response = error.to_dict()
+    response["error_code"] = (
+        "SERVICE_UNAVAILABLE"  # Override to ensure consistency with API contract for 503
+    )
+    return jsonify(response), error.status_code
+
+
+def handle_http_exception(error):
+    # werkzeug HTTP errors without a dedicated handler (405, 413, 415, ...)
+    # keep their status instead of falling through to the generic 500.
+    logger.warning("%s %s: %s", error.code, error.name, request.path)
+    response = APIException(
+        message=error.description,
+        status_code=error.code,
+        error_code=error.name.upper().replace(" ", "_"),
+    ).to_dict()
+    return jsonify(response), error.code
+
+
+def internal_error(error):
+    logger.error(
+        "Unhandled Exception: %s. Method: %s, Path: %s, IP: %s",
+        error,
+        request.method,
+        request.path,
+        request.remote_addr,
+        exc_info=_traceback_budget.consume(),
+    )
+    return _static_json_response(_GENERIC_500_BODY, APIException.status_code)
+
+
+def forbidden_error(error):
+    logger.warning("403 Forbidden: %s", error)
+    if error.description == Forbidden.description:
+        return _static_json_response(_FORBIDDEN_BODY, 403)
+    response = ForbiddenException(str(error)).to_dict()
+    return jsonify(response), 403
+
+
+# (code or exception class, handler) pairs, registered in this order.
+_ERROR_HANDLERS = (
+    (404, not_found_error),
+    (RateLimitExceeded, ratelimit_handler),
+    (PydanticValidationError, handle_pydantic_validation_error),
+    (MongoEngineValidationError, handle_mongoengine_validation_error),
+    (NotUniqueError, handle_not_unique_error),
+    (APIException, handle_api_exception),
+    (InfrastructureException, handle_infrastructure_exception),
+    (HTTPException, handle_http_exception),
+    (Exception, internal_error),
+    (403, forbidden_error),
+)
+
+
+def register_error_handlers(app) -> None:
+    """Register all application error handlers."""
+    for code_or_exception, handler in _ERROR_HANDLERS:
+        app.register_error_handler(code_or_exception, handler)
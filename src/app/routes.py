@@ -1,16 +1,18 @@
 """Blueprint registration helpers."""
 
+# Route modules are imported once at module load (amortised into interpreter
+# startup / gunicorn --preload) rather than inside every register call.
+import src.listeners  # noqa: F401
+from src.routes import (
+    content_management_routes,
+    api_routes,
+    auth_routes,
+    main_routes,
+)
+
 
 def register_blueprints(app) -> None:
     """Register all application blueprints."""
-    import src.listeners  # noqa: F401
-    from src.routes import (
-        content_management_routes,
-        api_routes,
-        auth_routes,
-        main_routes,
-    )
-
     # Register API/Auth blueprints FIRST
     app.register_blueprint(api_routes.bp)
     app.register_blueprint(auth_routes.bp)
@@ -2,7 +2,6 @@
 Security and auth configuration helpers for the Flask app factory.
 """
 
-import datetime
 import os
 from functools import wraps
 from typing import Callable, Any
@@ -13,7 +12,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from flask_talisman import Talisman
 
 from src.exceptions import UnauthorizedException
-from src.extensions import jwt, limiter
+from src.extensions import jwt, limiter, redis_client, redis_uri
 from src.repositories import get_user_repository
 
 
@@ -44,8 +43,11 @@ def permission_required(permission: str | list[str]) -> Callable:
             except Exception as e:
                 # Audit the failure before letting the error handler take over
                 current_app.logger.warning(
-                    f"SECURITY ALERT: unauthorized {request.method} attempt on {request.path} "
-                    f"by User {current_user_id}. Reason: {str(e)}"
+                    "SECURITY ALERT: unauthorized %s attempt on %s by User %s. Reason: %s",
+                    request.method,
+                    request.path,
+                    current_user_id,
+                    e,
                 )
                 raise
 
@@ -56,69 +58,87 @@ def permission_required(permission: str | list[str]) -> Callable:
     return decorator
 
 
+# JWT failure payloads never vary, so they are built once and only ever read by
+# Flask's JSON serializer.
+_MISSING_TOKEN_BODY = UnauthorizedException("Missing or invalid token.").to_dict()
+_INVALID_TOKEN_BODY = UnauthorizedException(
+    "Signature verification failed or token is malformed."
+).to_dict()
+_REVOKED_TOKEN_BODY = UnauthorizedException("Token has been revoked.").to_dict()
+_FRESH_TOKEN_REQUIRED_BODY = UnauthorizedException("Fresh token required.").to_dict()
+
+
 def register_jwt_loaders(jwt_manager) -> None:
     """Register JWT callback handlers."""
 
     @jwt_manager.unauthorized_loader
     def unauthorized_response(callback_exception):
-        return UnauthorizedException("Missing or invalid token.").to_dict(), 401
+        return _MISSING_TOKEN_BODY, 401
 
     @jwt_manager.invalid_token_loader
     def invalid_token_response(callback_exception):
-        return (
-            UnauthorizedException(
-                "Signature verification failed or token is malformed."
-            ).to_dict(),
-            401,
-        )
+        return _INVALID_TOKEN_BODY, 401
 
     @jwt_manager.revoked_token_loader
     def revoked_token_response(jwt_header, jwt_payload):
-        return UnauthorizedException("Token has been revoked.").to_dict(), 401
+        return _REVOKED_TOKEN_BODY, 401
 
     @jwt_manager.needs_fresh_token_loader
     def needs_fresh_token_response(callback_exception):
-        return UnauthorizedException("Fresh token required.").to_dict(), 401
+        return _FRESH_TOKEN_REQUIRED_BODY, 401
+
+
+# Browser features the site never uses; emitted by Talisman as Permissions-Policy.
+PERMISSIONS_POLICY = {
+    "geolocation": "()",
+    "microphone": "()",
+    "camera": "()",
+    "browsing-topics": "()",
+}
+
+# Built once at import and shared by every app instance; Talisman appends the
+# per-request script nonce itself.
+CONTENT_SECURITY_POLICY = {
+    "default-src": "'self'",
+    "script-src": [
+        "'self'",
+        "https://cdn.jsdelivr.net",
+        "https://cdnjs.cloudflare.com",
+        "https://challenges.cloudflare.com",
+    ],
+    "style-src": [
+        "'self'",
+        "https://cdn.jsdelivr.net",
+        "https://cdnjs.cloudflare.com",
+        "https://fonts.googleapis.com",
+        "'unsafe-inline'",
+    ],
+    "font-src": [
+        "https://fonts.gstatic.com",
+        "https://cdn.jsdelivr.net",
+    ],
+    "connect-src": [
+        "'self'",
+        "https://cdn.jsdelivr.net",
+        "https://challenges.cloudflare.com",
+    ],
+    "frame-src": [
+        "'self'",
+        "https://challenges.cloudflare.com",
+    ],
+    "img-src": "*",
+}
 
 
 def configure_http_security(app: Flask) -> None:
-    """Configure Talisman and extra response security headers."""
+    """Configure Talisman, which emits every response security header."""
     app_env = os.environ.get("FLASK_ENV", "development")
-    csp = {
-        "default-src": "'self'",
-        "script-src": [
-            "'self'",
-            "https://cdn.jsdelivr.net",
-            "https://cdnjs.cloudflare.com",
-            "https://challenges.cloudflare.com",
-        ],
-        "style-src": [
-            "'self'",
-            "https://cdn.jsdelivr.net",
-            "https://cdnjs.cloudflare.com",
-            "https://fonts.googleapis.com",
-            "'unsafe-inline'",
-        ],
-        "font-src": [
-            "https://fonts.gstatic.com",
-            "https://cdn.jsdelivr.net",
-        ],
-        "connect-src": [
-            "'self'",
-            "https://cdn.jsdelivr.net",
-            "https://challenges.cloudflare.com",
-        ],
-        "frame-src": [
-            "'self'",
-            "https://challenges.cloudflare.com",
-        ],
-        "img-src": "*",
-    }
 
     talisman_kwargs = {
-        "content_security_policy": csp,
+        "content_security_policy": CONTENT_SECURITY_POLICY,
         "content_security_policy_nonce_in": ["script-src"],
         "referrer_policy": "strict-origin-when-cross-origin",
+        "permissions_policy": PERMISSIONS_POLICY,
     }
 
     force_https = os.environ.get("TALISMAN_FORCE_HTTPS", "true").lower() == "true"
@@ -149,13 +169,6 @@ def configure_http_security(app: Flask) -> None:
 
     Talisman(app, **talisman_kwargs)
 
-    @app.after_request
-    def add_extra_security_headers(response):
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=()"
-        )
-        return response
-
 
 def configure_cors(app: Flask) -> None:
     """Configure API CORS from environment list."""
@@ -174,9 +187,23 @@ def configure_cors(app: Flask) -> None:
         )
 
 
+# Token lifetimes in seconds; Flask-JWT-Extended accepts ints directly.
+ACCESS_TOKEN_TTL_SECONDS = 15 * 60
+REFRESH_TOKEN_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# JWT settings that do not depend on the environment.
+_JWT_STATIC_CONFIG = {
+    "JWT_TOKEN_LOCATION": ["headers", "cookies"],
+    "JWT_ACCESS_COOKIE_PATH": "/api/",
+    "JWT_REFRESH_COOKIE_PATH": "/api/auth/refresh",
+    "JWT_ACCESS_TOKEN_EXPIRES": ACCESS_TOKEN_TTL_SECONDS,
+    "JWT_REFRESH_TOKEN_EXPIRES": REFRESH_TOKEN_TTL_SECONDS,
+}
+
+
 def configure_jwt(app: Flask) -> None:
     """Configure JWT extension, token callbacks, and cookie/token settings."""
-    app.config["JWT_SECRET_KEY"] = os.environ.get("SECRET_KEY")
+    app.config["JWT_SECRET_KEY"] = app.config["SECRET_KEY"]
     jwt.init_app(app)
     register_jwt_loaders(jwt)
 
@@ -187,24 +214,27 @@ def configure_jwt(app: Flask) -> None:
         auth_service = get_auth_service()
         return auth_service.is_token_revoked(jwt_payload)
 
-    app.config["JWT_TOKEN_LOCATION"] = ["headers", "cookies"]
-    app.config["JWT_COOKIE_SECURE"] = (
-        os.environ.get("JWT_COOKIE_SECURE", "true").lower() == "true"
+    app.config.update(
+        _JWT_STATIC_CONFIG,
+        JWT_COOKIE_SECURE=(
+            os.environ.get("JWT_COOKIE_SECURE", "true").lower() == "true"
+        ),
+        JWT_COOKIE_CSRF_PROTECT=(
+            os.environ.get("JWT_COOKIE_CSRF_PROTECT", "true").lower() == "true"
+        ),
+        JWT_COOKIE_SAMESITE=os.environ.get("JWT_COOKIE_SAMESITE", "Lax"),
     )
-    app.config["JWT_COOKIE_CSRF_PROTECT"] = (
-        os.environ.get("JWT_COOKIE_CSRF_PROTECT", "true").lower() == "true"
-    )
-    app.config["JWT_ACCESS_COOKIE_PATH"] = "/api/"
-    app.config["JWT_REFRESH_COOKIE_PATH"] = "/api/auth/refresh"
-    app.config["JWT_COOKIE_SAMESITE"] = os.environ.get("JWT_COOKIE_SAMESITE", "Lax")
-    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = datetime.timedelta(minutes=15)
-    app.config["JWT_REFRESH_TOKEN_EXPIRES"] = datetime.timedelta(days=7)
 
 
 def configure_rate_limiter(app: Flask) -> None:
     """Initialize Flask-Limiter on the current app."""
-    # Ensure storage_uri is set in app config before calling init_app
-    storage_uri = app.config.get("RATELIMIT_STORAGE_URI")
-    if storage_uri:
-        app.config["RATELIMIT_STORAGE_URI"] = storage_uri
+    # When the limiter counts in the same Redis the app already talks to,
+    # reuse that connection pool instead of opening a second one per worker.
+    # The fixed-window strategy is kept: one INCR/EXPIRE script call per
+    # limit, against the sorted-set bookkeeping of moving-window.
+    if app.config.get("RATELIMIT_STORAGE_URI") == redis_uri:
+        app.config.setdefault(
+            "RATELIMIT_STORAGE_OPTIONS",
+            {"connection_pool": redis_client.connection_pool},
+        )
     limiter.init_app(app)
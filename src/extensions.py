@@ -13,6 +13,12 @@ from flask_limiter.util import get_remote_address  # Add this import
 import os
 import redis
 
+from src.utils.env import load_environment
+
+# The Redis settings below are read from the environment at import time, so
+# the dotenv files must be loaded here, whichever module imports this first.
+load_environment()
+
 db = MongoEngine()
 bcrypt = Bcrypt()
 jwt = JWTManager()
@@ -22,8 +28,7 @@ limiter = Limiter(key_func=get_remote_address, strategy="fixed-window")
 # Sourced from the same URI as limiter for infrastructure consolidation
 redis_pass = os.environ.get("REDIS_PASSWORD", "changeme")
 redis_host = os.environ.get("REDIS_HOST", "redis")
-redis_client = redis.from_url(
-    os.environ.get(
-        "RATELIMIT_STORAGE_URI", f"redis://:{redis_pass}@{redis_host}:6379/0"
-    )
+redis_uri = os.environ.get(
+    "RATELIMIT_STORAGE_URI", f"redis://:{redis_pass}@{redis_host}:6379/0"
 )
+redis_client = redis.from_url(redis_uri)
@@ -8,6 +8,7 @@ from src.events import (
     article_created,
     article_updated,
     article_deleted,
+    article_published,
     user_logged_in,
     user_deleted,
 )
@@ -29,7 +30,7 @@ def cleanup_comments_on_article_delete(sender, **kwargs):
     try:
         delete_result = comment_repo.delete_by_article_id(article_id)
         current_app.logger.info(
-            f"Cleanup: Deleted {delete_result} comments for article_id={article_id}"
+            "Cleanup: Deleted %s comments for article_id=%s", delete_result, article_id
         )
     except Exception as e:
         logger.error(
@@ -57,27 +58,46 @@ def cleanup_user_data_on_delete(sender, **kwargs):
         if hasattr(comment_repo, "delete_by_author_id"):
             count = comment_repo.delete_by_author_id(user_id)
             current_app.logger.info(
-                f"GDPR Cleanup: Deleted {count} comments for user_id={user_id}"
+                "GDPR Cleanup: Deleted %s comments for user_id=%s", count, user_id
             )
         else:
             current_app.logger.warning(
-                f"GDPR Cleanup: Repository {type(comment_repo)} lacks delete_by_author_id. "
-                f"Comments for user_id={user_id} may be orphaned."
+                "GDPR Cleanup: Repository %s lacks delete_by_author_id. "
+                "Comments for user_id=%s may be orphaned.",
+                type(comment_repo),
+                user_id,
             )
     except Exception as e:
         logger.error("GDPR Cleanup failed for user_id %s: %s", user_id, e, exc_info=True)
 
 
+def invalidate_article_cache(sender, **kwargs):
+    """
+    Listener that drops cached public articles after any write: this worker's
+    L1 slug cache (when enabled) and the shared Redis blog index pages. Other
+    workers' L1 entries converge once they reach ARTICLE_CACHE_TTL_SECONDS.
+    """
+    from src.services import get_article_service, get_article_list_cache
+
+    try:
+        get_article_service().clear_public_cache()
+        get_article_list_cache().invalidate()
+    except Exception as e:
+        logger.error("Article cache invalidation failed: %s", e, exc_info=True)
+
+
 def log_blinker_event(sender, **kwargs):
     """A generic listener that logs all dispatched Blinker events."""
     event_name = kwargs.get("event_type", "unknown_signal")
     event_id = kwargs.get("event_id", "unknown")
-    log_message = f"Blinker Event Dispatched: {event_name} event_id={event_id}"
+    log_format = "Blinker Event Dispatched: %s event_id=%s"
+    log_args = [event_name, event_id]
     if kwargs:
-        log_message += f" - Data: {kwargs}"
+        log_format += " - Data: %s"
+        log_args.append(kwargs)
 
     try:
-        current_app.logger.info(log_message)
+        current_app.logger.info(log_format, *log_args)
     except Exception as e:
         logger.error(
             "Error in log_blinker_event for event '%s': %s",
@@ -92,6 +112,10 @@ article_created.connect(log_blinker_event)
 article_updated.connect(log_blinker_event)
 article_deleted.connect(log_blinker_event)
 article_deleted.connect(cleanup_comments_on_article_delete)
+article_created.connect(invalidate_article_cache)
+article_updated.connect(invalidate_article_cache)
+article_published.connect(invalidate_article_cache)
+article_deleted.connect(invalidate_article_cache)
 user_logged_in.connect(log_blinker_event)
 user_deleted.connect(log_blinker_event)
 user_deleted.connect(cleanup_user_data_on_delete)
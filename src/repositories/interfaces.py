@@ -7,7 +7,8 @@ query construction details.
 
 from __future__ import annotations
 
-from typing import Optional, Protocol, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol, TYPE_CHECKING
 import datetime
 
 if TYPE_CHECKING:
@@ -24,6 +25,28 @@ if TYPE_CHECKING:
     )
 
 
+@dataclass(frozen=True)
+class Page:
+    """A slice of query results plus the pagination metadata the API exposes."""
+
+    items: list[dict[str, Any]]
+    total: int
+    page: int
+    per_page: int
+
+    @property
+    def pages(self) -> int:
+        return -(-self.total // self.per_page) if self.per_page else 0
+
+    @property
+    def has_next(self) -> bool:
+        return self.page < self.pages
+
+    @property
+    def has_prev(self) -> bool:
+        return self.page > 1
+
+
 class UserRepository(Protocol):
     """Persistence contract for user lookups and writes."""
 
@@ -71,7 +94,7 @@ class ArticleRepository(Protocol):
 
     def list_all(self) -> list[Article]: ...
 
-    def get_published_paginated(self, page: int, per_page: int): ...
+    def get_published_paginated(self, page: int, per_page: int) -> Page: ...
 
     def get_by_id(self, article_id: str) -> Optional[Article]: ...
 
@@ -8,7 +8,16 @@ from pymongo.errors import PyMongoError
 
 from src.exceptions import DatabaseConnectionException
 from src.models.article import Article
-from src.repositories.interfaces import ArticleRepository
+from src.repositories.interfaces import ArticleRepository, Page
+
+# Fields rendered by the public blog index; everything else stays on the server.
+_PUBLISHED_LIST_PROJECTION = {
+    "_id": 0,
+    "title": 1,
+    "summary": 1,
+    "slug": 1,
+    "publication_date": 1,
+}
 
 
 class MongoArticleRepository(ArticleRepository):
@@ -22,14 +31,23 @@ class MongoArticleRepository(ArticleRepository):
                 f"Database error while listing all articles: {e}"
             ) from e
 
-    def get_published_paginated(self, page: int, per_page: int):
+    def get_published_paginated(self, page: int, per_page: int) -> Page:
+        """
+        Read-only listing served straight from the PyMongo collection.
+
+        Returns plain dicts so no Document instances are built for the index.
+        """
+        query = {"is_published": True}
         try:
-            return (
-                Article.objects(is_published=True)
-                .only("title", "summary", "slug", "publication_date")
-                .order_by("-publication_date")
-                .paginate(page=page, per_page=per_page)
+            collection = Article._get_collection()
+            total = collection.count_documents(query)
+            items = list(
+                collection.find(query, _PUBLISHED_LIST_PROJECTION)
+                .sort("publication_date", -1)
+                .skip((page - 1) * per_page)
+                .limit(per_page)
             )
+            return Page(items=items, total=total, page=page, per_page=per_page)
         except PyMongoError as e:
             raise DatabaseConnectionException(
                 f"Database error while fetching paginated published articles: {e}"
@@ -16,8 +16,10 @@ class MongoTokenRepository(TokenRepository):
     """MongoEngine implementation of token blocklist operations."""
 
     def is_jti_revoked(self, jti: str) -> bool:
+        # Existence check only: project _id and skip Document hydration.
         try:
-            return TokenBlocklist.objects(jti=jti).first() is not None
+            collection = TokenBlocklist._get_collection()
+            return collection.find_one({"jti": jti}, {"_id": 1}) is not None
         except PyMongoError as e:
             raise DatabaseConnectionException(
                 f"Database error while checking token jti={jti}: {e}"
@@ -8,6 +8,7 @@ from src.exceptions import BadRequestException
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from src.services import (
     get_article_service,
+    get_article_list_cache,
     get_profile_service,
     get_authz_service,
     get_auth_service,
@@ -18,6 +19,7 @@ from src.services import (
 
 bp = Blueprint("api_routes", __name__, url_prefix="/api")
 article_service = get_article_service()
+article_list_cache = get_article_list_cache()
 profile_service = get_profile_service()
 authz_service = get_authz_service()
 auth_service = get_auth_service()
@@ -26,6 +28,26 @@ email_service = get_email_service()
 contact_guard = get_contact_guard()
 
 
+# Page size requested by the SPA; only these pages are cached in Redis so
+# arbitrary per_page values cannot fan out into unbounded cache keys.
+_CACHED_PER_PAGE = 6
+
+
+def _conditional(response: Response) -> Response:
+    """Attach a content ETag and honour If-None-Match.
+
+    Clients revalidating an unchanged resource receive an empty 304 instead
+    of the full body.
+    """
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _conditional_json(payload: Dict[str, Any]) -> Response:
+    """Serialize a payload and return it as a conditional response."""
+    return _conditional(jsonify(payload))
+
+
 @bp.route("/bootstrap", methods=["GET"])
 @jwt_required(optional=True)
 def bootstrap_api() -> Response:
@@ -129,6 +151,14 @@ def blog_list_api() -> Response:
     if page < 1 or per_page < 1:
         raise BadRequestException("Page and per_page must be positive integers.")
 
+    cacheable = per_page == _CACHED_PER_PAGE
+    if cacheable:
+        body = article_list_cache.get(page, per_page)
+        if body is not None:
+            return _conditional(
+                current_app.response_class(body, mimetype="application/json")
+            )
+
     paginated_articles = article_service.list_published_articles(
         page=page, per_page=per_page
     )
@@ -137,7 +167,7 @@ def blog_list_api() -> Response:
         article_service.to_list_dict(article) for article in paginated_articles.items
     ]
 
-    return jsonify(
+    response = jsonify(
         {
             "articles": articles_summary,
             "pagination": {
@@ -150,6 +180,9 @@ def blog_list_api() -> Response:
             },
         }
     )
+    if cacheable:
+        article_list_cache.set(page, per_page, response.get_data())
+    return _conditional(response)
 
 
 @bp.route("/blog/<string:slug>", methods=["GET"])
@@ -169,8 +202,7 @@ def blog_article_api(slug: str) -> Response:
     if not re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", slug):
         raise BadRequestException("Invalid slug format.")
 
-    article = article_service.get_article_by_slug_or_404(slug)
-    return jsonify(article_service.to_public_dict(article))
+    return _conditional_json(article_service.get_public_article(slug))
 
 
 @bp.route("/license", methods=["GET"])
@@ -6,7 +6,7 @@ current authentication status.
 """
 
 import datetime
-import os
+import uuid
 from flask import Blueprint, request, jsonify, Response, current_app
 from flask_jwt_extended import (
     create_access_token,
@@ -16,7 +16,6 @@ from flask_jwt_extended import (
     set_access_cookies,
     set_refresh_cookies,
     unset_jwt_cookies,
-    decode_token,
     get_jwt,
 )
 from typing import Dict, Any
@@ -45,12 +44,10 @@ def login() -> Response:
     if not data or not data.get("username") or not data.get("password"):
         raise BadRequestException("Username and password are required")
 
-    if os.environ.get("TURNSTILE_LOGIN_ENABLED", "false").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    } and turnstile_service.enabled:
+    if (
+        current_app.config.get("TURNSTILE_LOGIN_ENABLED")
+        and turnstile_service.enabled
+    ):
         token = data.get("turnstile_token") or data.get("cf-turnstile-response")
         if not token:
             raise BadRequestException("Turnstile token is required.")
@@ -61,13 +58,15 @@ def login() -> Response:
     username = data["username"]
     password = data["password"]
 
-    current_app.logger.debug(f"Login attempt for username: '{username}'")
+    current_app.logger.debug("Login attempt for username: '%s'", username)
 
     try:
         user = auth_service.authenticate(username, password)
     except UnauthorizedException:
         current_app.logger.warning(
-            f"Failed login attempt for user: {username} from IP: {request.remote_addr}"
+            "Failed login attempt for user: %s from IP: %s",
+            username,
+            request.remote_addr,
         )
         raise
 
@@ -75,24 +74,25 @@ def login() -> Response:
     access_token = create_access_token(
         identity=str(user.id), additional_claims=token_claims
     )
+    # Pick the refresh jti here (explicit claims override the generated one)
+    # instead of decoding the token we just signed.
+    refresh_jti = str(uuid.uuid4())
     refresh_token = create_refresh_token(
-        identity=str(user.id), additional_claims=token_claims
+        identity=str(user.id), additional_claims={**token_claims, "jti": refresh_jti}
     )
 
     # Phase 3: Record active session in Redis
-    refresh_jti = decode_token(refresh_token)["jti"]
-    refresh_ttl = current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]
     auth_service.record_active_refresh_token(
         user_id=str(user.id),
         jti=refresh_jti,
-        ttl_seconds=int(refresh_ttl.total_seconds()),
+        ttl_seconds=int(current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]),
     )
 
     dispatch_event(
         user_logged_in, current_app._get_current_object(), user_id=str(user.id)
     )
     current_app.logger.info(
-        f"Successful login for user: {username} from IP: {request.remote_addr}"
+        "Successful login for user: %s from IP: %s", username, request.remote_addr
     )
 
     response = jsonify({"message": "Login successful"})
@@ -109,7 +109,7 @@ def register() -> Response:
     Restricted to users with USERS_MANAGE permission (Admins).
     """
     data = request.get_json()
-    user_data = UserRegistration(**data)
+    user_data = UserRegistration.model_validate(data)
 
     created_user = auth_service.register_user(
         username=user_data.username,
@@ -119,7 +119,9 @@ def register() -> Response:
     )
 
     current_app.logger.info(
-        f"Admin created new user: {created_user.username} with role: {created_user.role}"
+        "Admin created new user: %s with role: %s",
+        created_user.username,
+        created_user.role,
     )
 
     return (
@@ -174,13 +176,17 @@ def refresh() -> Response:
     # Phase 3: Enforce session validity
     if not auth_service.is_refresh_token_valid(current_user_id, refresh_jti):
         current_app.logger.warning(
-            f"Invalid refresh attempt for user ID: {current_user_id} with JTI: {refresh_jti}. "
-            "Session likely invalidated by a newer login."
+            "Invalid refresh attempt for user ID: %s with JTI: %s. "
+            "Session likely invalidated by a newer login.",
+            current_user_id,
+            refresh_jti,
         )
         raise UnauthorizedException("Session has expired or been invalidated")
 
     current_app.logger.info(
-        f"Token refreshed for user ID: {current_user_id} from IP: {request.remote_addr}"
+        "Token refreshed for user ID: %s from IP: %s",
+        current_user_id,
+        request.remote_addr,
     )
     user = auth_service.get_user_or_raise(current_user_id)
     new_access_token = create_access_token(
@@ -231,7 +237,7 @@ def change_password() -> Response:
     """
     Allows a logged-in user to change their password.
     """
-    data = ChangePasswordRequest(**request.get_json())
+    data = ChangePasswordRequest.model_validate(request.get_json())
     user_id = get_jwt_identity()
     auth_service.change_password(
         user_id=user_id,
@@ -239,7 +245,9 @@ def change_password() -> Response:
         new_password=data.new_password,
     )
     current_app.logger.info(
-        f"Password successfully changed for user ID: {user_id} from IP: {request.remote_addr}"
+        "Password successfully changed for user ID: %s from IP: %s",
+        user_id,
+        request.remote_addr,
     )
 
     return jsonify({"message": "Password updated successfully"}), 200
@@ -251,7 +259,7 @@ def change_email() -> Response:
     """
     Allows a logged-in user to change their email.
     """
-    data = ChangeEmailRequest(**request.get_json())
+    data = ChangeEmailRequest.model_validate(request.get_json())
     user_id = get_jwt_identity()
     auth_service.change_email(
         user_id=user_id,
@@ -259,7 +267,9 @@ def change_email() -> Response:
         new_email=data.new_email,
     )
     current_app.logger.info(
-        f"Email successfully changed for user ID: {user_id} from IP: {request.remote_addr}"
+        "Email successfully changed for user ID: %s from IP: %s",
+        user_id,
+        request.remote_addr,
     )
 
     return jsonify({"message": "Email updated successfully"}), 200
@@ -285,7 +295,9 @@ def delete_account() -> Response:
         current_password=data["current_password"],
     )
     current_app.logger.info(
-        f"Account successfully deleted for user ID: {user_id} from IP: {request.remote_addr}"
+        "Account successfully deleted for user ID: %s from IP: %s",
+        user_id,
+        request.remote_addr,
     )
 
     response = jsonify({"message": "Account deleted successfully"})
@@ -59,7 +59,7 @@ def create_article() -> Response:
     if not data:
         raise BadRequestException("Invalid JSON payload")
 
-    article_dto = ArticleCreateUpdate(**data)
+    article_dto = ArticleCreateUpdate.model_validate(data)
     article = article_service.create_article(article_dto, g.current_user)
     return jsonify(article_service.to_public_dict(article)), 201
 
@@ -97,7 +97,7 @@ def update_article(article_id: str) -> Response:
     if not data:
         raise BadRequestException("Invalid JSON payload")
 
-    article_dto = ArticleCreateUpdate(**data)
+    article_dto = ArticleCreateUpdate.model_validate(data)
     article = article_service.update_article(article_id, article_dto, g.current_user)
     return jsonify(article_service.to_public_dict(article)), 200
 
@@ -143,7 +143,7 @@ def update_profile() -> Response:
     if not data:
         raise BadRequestException("Invalid JSON payload")
 
-    profile_data = ProfileSchema(**data)
+    profile_data = ProfileSchema.model_validate(data)
     updated_profile = profile_service.update_profile(profile_data, g.current_user)
     return jsonify(updated_profile.model_dump()), 200
 
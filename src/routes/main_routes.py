@@ -4,8 +4,7 @@ This module defines the main route for the Flask application.
 It serves the primary HTML shell for the Single Page Application (SPA).
 """
 
-import os
-from flask import Blueprint, render_template, Response, request, abort
+from flask import Blueprint, render_template, Response, request, abort, current_app
 
 bp = Blueprint("main_routes", __name__)
 
@@ -23,19 +22,10 @@ def index(path: str) -> Response:
     if request.path.startswith("/api/"):
         abort(404)
 
-    turnstile_site_key = os.environ.get("TURNSTILE_SITE_KEY", "")
-    turnstile_enabled = (
-        os.environ.get("TURNSTILE_ENABLED", "true").strip().lower()
-        in {"1", "true", "yes", "on"}
-    )
-    turnstile_login_enabled = (
-        os.environ.get("TURNSTILE_LOGIN_ENABLED", "false").strip().lower()
-        in {"1", "true", "yes", "on"}
-    )
-
+    config = current_app.config
     return render_template(
         "base.html",
-        turnstile_site_key=turnstile_site_key,
-        turnstile_enabled=turnstile_enabled,
-        turnstile_login_enabled=turnstile_login_enabled,
+        turnstile_site_key=config.get("TURNSTILE_SITE_KEY", ""),
+        turnstile_enabled=config.get("TURNSTILE_ENABLED", True),
+        turnstile_login_enabled=config.get("TURNSTILE_LOGIN_ENABLED", False),
     )
@@ -1,10 +1,32 @@
 """Pydantic schemas for article data validation and DTOs."""
 
+import threading
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional
-import bleach
+from bleach.sanitizer import Cleaner
 from .base import ALLOWED_TAGS, ALLOWED_ATTRS
 
+# bleach.clean() builds a new Cleaner (and html5lib parser) on every call.
+# Cleaners keep parser state and are not thread-safe, so each thread builds
+# its pair once and reuses it.
+_cleaners = threading.local()
+
+
+def _content_cleaner() -> Cleaner:
+    cleaner = getattr(_cleaners, "content", None)
+    if cleaner is None:
+        cleaner = _cleaners.content = Cleaner(
+            tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRS
+        )
+    return cleaner
+
+
+def _summary_cleaner() -> Cleaner:
+    cleaner = getattr(_cleaners, "summary", None)
+    if cleaner is None:
+        cleaner = _cleaners.summary = Cleaner(tags=[], attributes={})
+    return cleaner
+
 
 class ArticleCreateUpdate(BaseModel):
     """Schema for creating or updating an article."""
@@ -17,12 +39,12 @@ class ArticleCreateUpdate(BaseModel):
     @field_validator("content")
     @classmethod
     def sanitize_content(cls, v: str) -> str:
-        return bleach.clean(v, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRS)
+        return _content_cleaner().clean(v)
 
     @field_validator("summary")
     @classmethod
     def sanitize_summary(cls, v: str) -> str:
-        return bleach.clean(v, tags=[], attributes={})
+        return _summary_cleaner().clean(v)
 
 
 class ArticlePublic(BaseModel):
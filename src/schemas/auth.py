@@ -1,12 +1,12 @@
 """Pydantic schemas for authentication and user identity."""
 
 from pydantic import BaseModel, Field, field_validator, ValidationInfo
-from .base import password_strength_validator
+from .base import EMAIL_MAX_LENGTH, EMAIL_PATTERN, password_strength_validator
 
 
 class UserRegistration(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
-    email: str = Field(..., pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    email: str = Field(..., max_length=EMAIL_MAX_LENGTH, pattern=EMAIL_PATTERN)
     password: str
 
     @field_validator("password")
@@ -27,7 +27,7 @@ class ChangePasswordRequest(BaseModel):
 
 class ChangeEmailRequest(BaseModel):
     current_password: str
-    new_email: str = Field(..., pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    new_email: str = Field(..., max_length=EMAIL_MAX_LENGTH, pattern=EMAIL_PATTERN)
 
 
 class UserIdentity(BaseModel):
@@ -4,6 +4,12 @@ from pydantic import ValidationInfo
 from password_strength import PasswordPolicy
 import bleach
 
+# --- Email Format ---
+# Pydantic compiles ``pattern`` with pydantic-core's Rust regex engine, which
+# matches in linear time, so this is safe against backtracking floods.
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+EMAIL_MAX_LENGTH = 254
+
 # --- Password Policy ---
 password_policy = PasswordPolicy.from_names(length=8, uppercase=1, numbers=1, special=1)
 
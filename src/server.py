@@ -4,11 +4,13 @@ Application factory for the Flask web application.
 This module composes app bootstrap modules and exposes `create_app`.
 """
 
+from typing import Optional
+
 from src.app.bootstrap import (
     configure_core_runtime,
+    configure_logging,
     configure_proxy_fix,
     create_flask_app,
-    load_environment,
 )
 from src.app.errors import register_error_handlers
 from src.app.routes import register_blueprints
@@ -20,16 +22,22 @@ from src.app.security import (
 )
 
 
-def create_app():
+def create_app(config_overrides: Optional[dict] = None):
     """
     Creates and configures the Flask application instance.
 
+    Args:
+        config_overrides (dict, optional): Config values applied before the
+            factory steps run, taking precedence over the environment for
+            settings that honour them (SECRET_KEY, BCRYPT_LOG_ROUNDS).
+
     Returns:
         Flask: The configured Flask application instance.
     """
-    load_environment()
-
     app = create_flask_app(__name__)
+    if config_overrides:
+        app.config.update(config_overrides)
+    configure_logging(app)
     configure_proxy_fix(app)
     configure_core_runtime(app)
     configure_http_security(app)
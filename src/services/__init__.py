@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from src.services.auth_service import AuthService
     from src.services.authz_service import AuthzService
     from src.services.article_service import ArticleService
+    from src.services.article_list_cache import ArticleListCache
     from src.services.session_service import SessionService
     from src.services.profile_service import ProfileService
     from src.services.media_service import MediaService
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
 _auth_service = None
 _authz_service = None
 _article_service = None
+_article_list_cache = None
 _session_service = None
 _profile_service = None
 _media_service = None
@@ -54,12 +56,20 @@ def get_auth_service() -> "AuthService":
             get_mongo_token_repository,
         )
         from src.services.auth_service import AuthService
+        from src.utils.ttl_cache import TTLCache
 
         _auth_service = AuthService(
             get_user_repository(),
             get_token_repository(),
             get_mongo_token_repository(),
             get_session_service(),
+            revoked_cache=TTLCache(maxsize=4096, ttl=900),
+            # Off by default: a non-zero TTL lets a revocation made by another
+            # worker go unnoticed here for up to that many seconds.
+            unrevoked_cache=TTLCache(
+                maxsize=10000,
+                ttl=int(os.environ.get("REVOCATION_NEGATIVE_CACHE_TTL_SECONDS", 0)),
+            ),
         )
     return _auth_service
 
@@ -81,13 +91,36 @@ def get_article_service() -> "ArticleService":
     if _article_service is None:
         from src.repositories import get_article_repository, get_user_repository
         from src.services.article_service import ArticleService
+        from src.utils.ttl_cache import TTLCache
 
         _article_service = ArticleService(
-            get_article_repository(), get_user_repository()
+            get_article_repository(),
+            get_user_repository(),
+            # Off by default: writes only clear this worker's copy, so a
+            # non-zero TTL lets other workers serve an unpublished or deleted
+            # article for up to that many seconds.
+            public_cache=TTLCache(
+                maxsize=int(os.environ.get("ARTICLE_CACHE_MAXSIZE", "512")),
+                ttl=float(os.environ.get("ARTICLE_CACHE_TTL_SECONDS", "0")),
+            ),
         )
     return _article_service
 
 
+def get_article_list_cache() -> "ArticleListCache":
+    """Return the singleton Redis cache for rendered blog index pages."""
+    global _article_list_cache
+    if _article_list_cache is None:
+        from src.extensions import redis_client
+        from src.services.article_list_cache import ArticleListCache
+
+        _article_list_cache = ArticleListCache(
+            redis_client,
+            ttl_seconds=int(os.environ.get("ARTICLE_LIST_CACHE_TTL_SECONDS", "300")),
+        )
+    return _article_list_cache
+
+
 def get_post_service() -> "ArticleService":
     """Legacy alias for backward compatibility during refactor."""
     return get_article_service()
@@ -0,0 +1,63 @@
+"""Redis cache for rendered blog index pages."""
+
+from __future__ import annotations
+import logging
+from typing import Optional
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleListCache:
+    """
+    Caches serialized blog index pages in Redis.
+
+    Every live key is recorded in a dependency set so invalidation is a single
+    SMEMBERS + pipelined DEL rather than a KEYS scan. The cache fails open:
+    Redis errors are logged and treated as misses.
+    """
+
+    def __init__(self, redis_client: Redis, ttl_seconds: int = 300):
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+        self._prefix = "blog:list:"
+        self._deps_key = "blog:list:deps"
+
+    def _key(self, page: int, per_page: int) -> str:
+        return f"{self._prefix}{page}:{per_page}"
+
+    def get(self, page: int, per_page: int) -> Optional[bytes]:
+        """Return the cached body for a page, or None on a miss."""
+        if self._ttl <= 0:
+            return None
+        try:
+            return self._redis.get(self._key(page, per_page))
+        except RedisError as e:
+            logger.warning("Article list cache read failed: %s", e)
+            return None
+
+    def set(self, page: int, per_page: int, body: bytes) -> None:
+        """Store a rendered page and register its key in the dependency set."""
+        if self._ttl <= 0:
+            return
+        key = self._key(page, per_page)
+        try:
+            pipe = self._redis.pipeline()
+            pipe.setex(key, self._ttl, body)
+            pipe.sadd(self._deps_key, key)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning("Article list cache write failed: %s", e)
+
+    def invalidate(self) -> None:
+        """Drop every cached page recorded in the dependency set."""
+        try:
+            keys = self._redis.smembers(self._deps_key)
+            pipe = self._redis.pipeline()
+            if keys:
+                pipe.delete(*keys)
+            pipe.delete(self._deps_key)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning("Article list cache invalidation failed: %s", e)
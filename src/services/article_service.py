@@ -5,9 +5,12 @@ Agnostic: No direct DB model imports.
 
 from __future__ import annotations
 import datetime
+import re
+from typing import Optional
 from slugify import slugify
 
 from src.exceptions import (
+    BadRequestException,
     ConflictException,
     NotFoundException,
     ForbiddenException,
@@ -22,16 +25,25 @@ from src.events import (
 )
 from src.repositories.interfaces import ArticleRepository, UserRepository
 from src.schemas import UserIdentity, ArticleCreateUpdate, ArticlePublic
+from src.utils.ttl_cache import TTLCache
+
+# Article IDs are Mongo ObjectIds: 24 hex characters.
+_ARTICLE_ID_RE = re.compile(r"[0-9a-fA-F]{24}")
 
 
 class ArticleService:
     """Application service that encapsulates article domain workflows."""
 
     def __init__(
-        self, article_repository: ArticleRepository, user_repository: UserRepository
+        self,
+        article_repository: ArticleRepository,
+        user_repository: UserRepository,
+        public_cache: Optional[TTLCache] = None,
     ):
         self._article_repository = article_repository
         self._user_repository = user_repository
+        # Per-process L1 of public article DTOs keyed by slug (disabled if None).
+        self._public_cache = public_cache or TTLCache(maxsize=0, ttl=0)
 
     def _require_ownership_or_admin(
         self, article, user: UserIdentity, action: str
@@ -62,7 +74,7 @@ class ArticleService:
 
         Logic:
         1. Filters by is_published=True.
-        2. Projects only necessary fields for performance (via Repository).
+        2. Projects only necessary fields as raw documents (via Repository).
         3. Orders by publication_date descending.
 
         Args:
@@ -70,11 +82,17 @@ class ArticleService:
             per_page (int): The number of items per page.
 
         Returns:
-            Pagination: A MongoEngine pagination object containing Article models.
+            Page: Raw article documents plus pagination metadata.
+
+        Raises:
+            NotFoundException: If a page beyond the first has no articles.
         """
-        return self._article_repository.get_published_paginated(
+        page_result = self._article_repository.get_published_paginated(
             page=page, per_page=per_page
         )
+        if not page_result.items and page != 1:
+            raise NotFoundException("Page not found")
+        return page_result
 
     def to_public_dict(self, article) -> dict:
         """
@@ -108,20 +126,43 @@ class ArticleService:
             author_username=article.author.username if article.author else None,
         ).model_dump()
 
-    def to_list_dict(self, article) -> dict:
-        """Map a persisted article to the public list DTO used by the blog index."""
+    def to_list_dict(self, article: dict) -> dict:
+        """Map a raw article document to the public list DTO used by the blog index."""
+        publication_date = article.get("publication_date")
         return {
-            "title": article.title,
-            "summary": article.summary or "",
-            "slug": article.slug,
+            "title": article.get("title"),
+            "summary": article.get("summary") or "",
+            "slug": article.get("slug"),
             "publication_date": (
-                article.publication_date.replace(microsecond=0).isoformat()
-                if article.publication_date
+                publication_date.replace(microsecond=0).isoformat()
+                if publication_date
                 else None
             ),
         }
 
+    def get_public_article(self, slug: str) -> dict:
+        """
+        Return the public DTO for a slug, served from the per-process cache
+        when warm.
+
+        Raises:
+            NotFoundException: If no article matches the slug.
+        """
+        cached = self._public_cache.get(slug)
+        if cached is not None:
+            return cached
+        public = self.to_public_dict(self.get_article_by_slug_or_404(slug))
+        self._public_cache.set(slug, public)
+        return public
+
+    def clear_public_cache(self) -> None:
+        """Drop every cached public article (called on any article write)."""
+        self._public_cache.clear()
+
     def get_article_or_404(self, article_id: str):
+        # Reject malformed IDs before they reach the ORM or the database.
+        if not _ARTICLE_ID_RE.fullmatch(article_id):
+            raise BadRequestException("Invalid article ID")
         article = self._article_repository.get_by_id(article_id)
         if not article:
             raise NotFoundException("Article not found")
@@ -12,6 +12,7 @@ from src.models.user import User
 from src.repositories.interfaces import UserRepository, TokenRepository
 from src.services.roles import build_claim_roles_for_role
 from src.schemas.base import password_policy
+from src.utils.ttl_cache import TTLCache
 
 if TYPE_CHECKING:
     from src.services.session_service import SessionService
@@ -31,6 +32,8 @@ class AuthService:
         token_repository: TokenRepository,
         mongo_token_repository: TokenRepository | None = None,
         session_service: SessionService | None = None,
+        revoked_cache: TTLCache | None = None,
+        unrevoked_cache: TTLCache | None = None,
     ):
         """Initialize the AuthService with required repositories and services.
 
@@ -39,11 +42,19 @@ class AuthService:
             token_repository: Primary (Redis) repository for token blocklisting.
             mongo_token_repository: Secondary (Mongo) repository for persistent revocation.
             session_service: Service for managing active sessions and refresh tokens.
+            revoked_cache: Optional in-process cache of JTIs known to be revoked.
+            unrevoked_cache: Optional short-lived cache of JTIs that passed the
+                blocklist check. Disabled unless explicitly configured.
         """
         self._user_repository = user_repository
         self._token_repository = token_repository
         self._mongo_token_repository = mongo_token_repository
         self._session_service = session_service
+        # Revocation is permanent, so a positive entry can never go stale.
+        # Negative results are only cached when opted into: a logout handled
+        # by another worker is then honoured here after at most the cache TTL.
+        self._revoked_cache = revoked_cache or TTLCache(maxsize=0, ttl=0)
+        self._unrevoked_cache = unrevoked_cache or TTLCache(maxsize=0, ttl=0)
 
     def _validate_password_strength(self, password: str) -> None:
         """Enforces the centralized password complexity policy.
@@ -354,6 +365,8 @@ class AuthService:
             expires_at: The timestamp when the token would have expired.
         """
         self._token_repository.add_to_blocklist(jti, expires_at)
+        self._revoked_cache.set(jti, True)
+        self._unrevoked_cache.pop(jti)
         # Also store in Mongo for long-term persistence/recovery
         if self._mongo_token_repository:
             try:
@@ -381,19 +394,27 @@ class AuthService:
         if not jti:
             return True
 
-        # 1. Redis Check
+        # 0. Local Check (replayed revoked tokens never leave the process)
+        if self._revoked_cache.get(jti):
+            return True
+
+        # 1. Redis Check (skipped while the JTI is cached as not revoked)
         from src.exceptions import DatabaseConnectionException
 
-        try:
-            if self._token_repository.is_jti_revoked(jti):
-                return True
-        except DatabaseConnectionException:
-            # 2. Redis Down -> Mongo Fallback
-            if (
-                self._mongo_token_repository
-                and self._mongo_token_repository.is_jti_revoked(jti)
-            ):
-                return True
+        if not self._unrevoked_cache.get(jti):
+            try:
+                if self._token_repository.is_jti_revoked(jti):
+                    self._revoked_cache.set(jti, True)
+                    return True
+            except DatabaseConnectionException:
+                # 2. Redis Down -> Mongo Fallback
+                if (
+                    self._mongo_token_repository
+                    and self._mongo_token_repository.is_jti_revoked(jti)
+                ):
+                    self._revoked_cache.set(jti, True)
+                    return True
+            self._unrevoked_cache.set(jti, True)
 
         if not user_id:
             return True
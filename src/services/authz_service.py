@@ -91,8 +91,11 @@ class AuthzService:
         claim_version = user_claims.get("tv")
         if claim_version is None or user_doc.token_version != claim_version:
             current_app.logger.warning(
-                f"Security event: Token version mismatch for user {user_id}. "
-                f"DB: {user_doc.token_version}, JWT: {claim_version}. Access denied."
+                "Security event: Token version mismatch for user %s. "
+                "DB: %s, JWT: %s. Access denied.",
+                user_id,
+                user_doc.token_version,
+                claim_version,
             )
             raise UnauthorizedException("Session has expired or been invalidated.")
 
@@ -105,8 +108,11 @@ class AuthzService:
         user_permissions = get_permissions_for_role(user_doc.role)
         if not (required_permissions & user_permissions):
             current_app.logger.warning(
-                f"Permission mismatch: User {user_id} has role '{user_doc.role}' "
-                f"which lacks any of the required permissions: {required_permissions}."
+                "Permission mismatch: User %s has role '%s' "
+                "which lacks any of the required permissions: %s.",
+                user_id,
+                user_doc.role,
+                required_permissions,
             )
             raise ForbiddenException(error_message)
 
@@ -114,9 +120,11 @@ class AuthzService:
         claims_permissions = get_permissions_from_claims(user_claims)
         if not (required_permissions & claims_permissions):
             current_app.logger.warning(
-                f"Unauthorized access attempt: User {user_id} lacks required permissions "
-                f"in JWT claims. Roles in claims: {user_claims.get('roles', 'N/A')}. "
-                f"From IP: {request.remote_addr}"
+                "Unauthorized access attempt: User %s lacks required permissions "
+                "in JWT claims. Roles in claims: %s. From IP: %s",
+                user_id,
+                user_claims.get("roles", "N/A"),
+                request.remote_addr,
             )
             raise ForbiddenException(error_message)
 
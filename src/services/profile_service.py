@@ -236,7 +236,7 @@ class ProfileService:
 
         saved_profile = self._profile_repository.save(profile)
         logger.info(
-            f"Developer profile updated by user: {user.username} (ID: {user.id})"
+            "Developer profile updated by user: %s (ID: %s)", user.username, user.id
         )
 
         return self.get_profile()  # Returns the hydrated Public DTO
@@ -286,11 +286,15 @@ class ProfileService:
             profile_doc.image_url = new_url
             profile_doc.image_hash = file_hash
             profile_doc.image_filename = original_filename
-            profile_doc.image_uploaded_at = datetime.datetime.now(datetime.timezone.utc)
-            profile_doc.last_updated = datetime.datetime.now(datetime.timezone.utc)
+            now = datetime.datetime.now(datetime.timezone.utc)
+            profile_doc.image_uploaded_at = now
+            profile_doc.last_updated = now
 
         self._profile_repository.save(profile_doc)
         logger.info(
-            f"Profile photo replaced by user: {user.username} (ID: {user.id}). URL: {new_url}"
+            "Profile photo replaced by user: %s (ID: %s). URL: %s",
+            user.username,
+            user.id,
+            new_url,
         )
         return new_url
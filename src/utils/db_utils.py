@@ -17,5 +17,5 @@ def check_db_connection(app):
             app.logger.info("Database connection successful.")
             return True
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
-            app.logger.error(f"Failed to connect to MongoDB: {e}")
+            app.logger.error("Failed to connect to MongoDB: %s", e)
             return False
@@ -0,0 +1,19 @@
+"""Process-wide loading of the dotenv configuration files."""
+
+from dotenv import load_dotenv
+
+_environment_loaded = False
+
+
+def load_environment() -> None:
+    """Load environment variables from the local environment, .env, and config.env files.
+
+    The files are parsed once per process; later calls are no-ops.
+    """
+    global _environment_loaded
+    if _environment_loaded:
+        return
+    # Load config.env first so that .env can override its values (secrets vs defaults)
+    load_dotenv("config.env")
+    load_dotenv(".env")
+    _environment_loaded = True
@@ -5,25 +5,64 @@ This module provides a function to configure logging for the Flask application,
 including file rotation and console output.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Background listener that owns the real (blocking) handlers, and the queue
+# handler that feeds it from the root logger.
+_listener = None
+_queue_handler = None
+# (log file, level) the current listener was built for.
+_configured_for = None
+
+
+def _stop_listener():
+    """Flush and stop the current listener, closing the handlers it owns."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _restart_listener_in_child():
+    # Threads do not survive fork, so gunicorn --preload workers need their
+    # own listener draining the inherited queue.
+    global _listener
+    if _listener is not None:
+        _listener = QueueListener(
+            _listener.queue, *_listener.handlers, respect_handler_level=True
+        )
+        _listener.start()
+
+
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_restart_listener_in_child)
+
 
 def setup_logging(app):
     """
     Configures logging for the Flask application.
 
-    Logs are written to both a rotating file (app.log) and the console.
+    Logs are written to both a rotating file (app.log) and the console. The
+    root logger only enqueues records; a QueueListener thread does the I/O.
     The log level is determined by the 'LOG_LEVEL' environment variable,
     defaulting to INFO.
 
     Args:
         app (Flask): The Flask application instance.
 
+    Calling it again with the same file and level reuses the running
+    listener; otherwise the previous queue handler and listener are replaced,
+    so repeated app creation never stacks handlers on the root logger.
+
     Returns:
-        logging.Logger: The configured logger instance.
+        logging.Logger: The configured (root) logger instance.
     """
     log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
     numeric_level = getattr(logging, log_level, logging.INFO)
@@ -38,6 +77,13 @@ def setup_logging(app):
     logger = logging.getLogger()  # Get the root logger
     logger.setLevel(numeric_level)
 
+    global _listener, _queue_handler, _configured_for
+    if (
+        _configured_for == (log_file, numeric_level)
+        and _queue_handler in logger.handlers
+    ):
+        return logger
+
     # Create handlers
     # File handler - rotates logs after 1MB, keeps 5 backups
     file_handler = RotatingFileHandler(log_file, maxBytes=1024 * 1024, backupCount=5)
@@ -54,10 +100,18 @@ def setup_logging(app):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Request threads only enqueue; the listener thread writes to file/console.
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+    _stop_listener()
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    _queue_handler = QueueHandler(log_queue)
+    logger.addHandler(_queue_handler)
+    _configured_for = (log_file, numeric_level)
 
-    # Attach logger to Flask app for easy access
-    app.logger = logger
+    # app.logger is left as Flask's own named logger; it propagates here.
     return logger
@@ -9,29 +9,68 @@ os.environ.setdefault("MONGO_TEST_DB", "pytest_appdb")
 if os.environ.get("DOCKER_CONTAINER") in {"1", "true"} and "E2E_BASE_URL" not in os.environ:
     os.environ["E2E_BASE_URL"] = "http://nginx"
 
-import re
 import pytest
-from flask import Flask
+from flask import Flask, g
 from dotenv import load_dotenv
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 load_dotenv()
 from src.server import create_app
-from mongoengine import disconnect, connect, get_db
+from mongoengine import disconnect, get_db
+from pymongo import monitoring
 from pymongo.errors import ServerSelectionTimeoutError
 from src.models.user import User
 from src.models.article import Article
 from src.extensions import limiter
 
-def _clear_test_collections() -> None:
-    db = get_db()
-    db.get_collection(User._get_collection_name()).delete_many({})
-    db.get_collection(Article._get_collection_name()).delete_many({})
+
+class _WriteTracker(monitoring.CommandListener):
+    """Records which collections received writes since the last cleanup."""
+
+    _WRITE_COMMANDS = frozenset({"insert", "update", "delete", "findAndModify"})
+
+    def __init__(self):
+        self._dirty = set()
+
+    def started(self, event):
+        if event.command_name in self._WRITE_COMMANDS:
+            self._dirty.add(event.command.get(event.command_name))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def drain(self) -> set:
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+
+# Registered before create_app() so the app's MongoClient reports to it.
+_write_tracker = _WriteTracker()
+monitoring.register(_write_tracker)
+
+
+def _clear_test_collections(only_dirty: bool = False) -> None:
     from src.models.token_blocklist import TokenBlocklist
     from src.models.profile import Profile
 
-    db.get_collection(TokenBlocklist._get_collection_name()).delete_many({})
-    db.get_collection(Profile._get_collection_name()).delete_many({})
+    dirty = _write_tracker.drain()
+    db = get_db()
+    for model in (User, Article, TokenBlocklist, Profile):
+        name = model._get_collection_name()
+        if not only_dirty or name in dirty:
+            db.get_collection(name).delete_many({})
+    # Our own deletes are not test writes.
+    _write_tracker.drain()
+
+    # Tests also write articles directly through the model, bypassing the
+    # signals that normally invalidate the per-process article cache.
+    from src.services import get_article_service, get_article_list_cache
+
+    get_article_service().clear_public_cache()
+    get_article_list_cache().invalidate()
 
 
 def _build_test_mongo_uri(in_container: bool) -> str:
@@ -131,27 +170,6 @@ def base_url(request):
     return f"http://localhost:{host_port}"
 
 
-@pytest.fixture(scope="session", autouse=True)
-def database_connection_check():
-    """
-    Gatekeeper fixture to check for database connection before running tests.
-    Can be skipped with SKIP_DB_CHECK=1 for E2E tests where the runner doesn't need DB access.
-    """
-    if os.environ.get("SKIP_DB_CHECK") == "1":
-        return
-
-    mongo_uri = _build_test_mongo_uri(bool(os.environ.get("DOCKER_CONTAINER")))
-
-    try:
-        client = connect(
-            host=mongo_uri, serverSelectionTimeoutMS=2000, uuidRepresentation="standard"
-        )
-        client.server_info()
-        disconnect()
-    except ServerSelectionTimeoutError as e:
-        pytest.exit(f"Database connection failed: {e}. Aborting tests.")
-
-
 @pytest.fixture(scope="session")
 def app():
     """Create and configure a new app instance for the test session."""
@@ -163,18 +181,37 @@ def app():
         yield dummy_app
         return
 
+    # Session-wide env overrides, restored when the session ends.
+    session_env = pytest.MonkeyPatch()
     # Determine MONGO_URI based on environment
     mongo_uri = _build_test_mongo_uri(bool(os.environ.get("DOCKER_CONTAINER")))
-    os.environ["MONGO_URI"] = mongo_uri
-    os.environ["SECRET_KEY"] = "test-secret-key-32-bytes-min-length-012345"
-    
-    # In local development/test containers, we must disable HTTPS forcing 
+    session_env.setenv("MONGO_URI", mongo_uri)
+
+    # In local development/test containers, we must disable HTTPS forcing
     # because nginx is usually only listening on port 80 (HTTP).
     # Staging/Production will override this via their own env vars.
-    os.environ["FLASK_ENV"] = "development"
-    os.environ["TALISMAN_FORCE_HTTPS"] = "false"
+    session_env.setenv("FLASK_ENV", "development")
+    session_env.setenv("TALISMAN_FORCE_HTTPS", "false")
+    # Keep the app's console handler quiet under capture; INFO records still
+    # reach pytest's log file. An explicit LOG_LEVEL wins for debugging runs.
+    if "LOG_LEVEL" not in os.environ:
+        session_env.setenv("LOG_LEVEL", "WARNING")
+    # create_app() probes Mongo itself; keep each attempt short so an
+    # unreachable database aborts the run quickly.
+    if "MONGO_SERVER_SELECTION_TIMEOUT_MS" not in os.environ:
+        session_env.setenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "2000")
 
-    app = create_app()
+    try:
+        app = create_app(
+            config_overrides={
+                "SECRET_KEY": "test-secret-key-32-bytes-min-length-012345",
+                # Minimum bcrypt cost: every login and set_password hashes.
+                "BCRYPT_LOG_ROUNDS": 4,
+            }
+        )
+    except ConnectionError as e:
+        session_env.undo()
+        pytest.exit(f"Database connection failed: {e}. Aborting tests.")
     app.config.update(
         {
             "TESTING": True,
@@ -188,6 +225,17 @@ def app():
     # Initialize and configure limiter for testing
     limiter.init_app(app)
 
+    # pytest-flask keeps one app context (and so one ``g``) pushed for the
+    # whole test, and every client request reuses it. Flask-Limiter marks
+    # ``g`` once a request has been checked, so later requests in the same
+    # test would skip their limits. Clear the mark first thing per request.
+    def _reset_rate_limit_marks():
+        for attr in list(vars(g)):
+            if attr.endswith("_rate_limiting_complete"):
+                g.pop(attr)
+
+    app.before_request_funcs.setdefault(None, []).insert(0, _reset_rate_limit_marks)
+
     # Establish an application context before yielding the app
     with app.app_context():
         try:
@@ -203,51 +251,102 @@ def app():
         except ServerSelectionTimeoutError:
             pass
         disconnect()
+    session_env.undo()
 
 
 @pytest.fixture(autouse=True)
-def reset_rate_limiter():
-    """Resets the Flask-Limiter storage before each test function."""
+def reset_rate_limiter(request):
+    """Resets the Flask-Limiter storage before each test that sends requests."""
+    # Counters only move when a request goes through the test client; other
+    # tests skip the Redis round trip unless marked ``ratelimit``.
+    if (
+        "client" not in request.fixturenames
+        and request.node.get_closest_marker("ratelimit") is None
+    ):
+        return
     # Only reset if the limiter storage has been initialized
     if limiter._storage:
         limiter.reset()
 
 
+@pytest.fixture(scope="session")
+def password_hash_for(app):
+    """Return a function giving the bcrypt hash of a password, memoized per session.
+
+    Fixtures that create users with the same password reuse one hash instead
+    of running bcrypt for every user they insert.
+    """
+    hashes = {}
+
+    def _hash(password):
+        if password not in hashes:
+            with app.app_context():
+                probe = User()
+                probe.set_password(password)
+                hashes[password] = probe.password_hash
+        return hashes[password]
+
+    return _hash
+
+
+@pytest.fixture(scope="session")
+def test_password_hash(password_hash_for):
+    """bcrypt hash of the shared "testpassword", computed once per session."""
+    return password_hash_for("testpassword")
+
+
 @pytest.fixture(scope="function")
-def setup_users(app):
+def setup_users(app, test_password_hash):
     """Sets up test users for authentication tests."""
     with app.app_context():
-        admin_user = User(username="testadmin", email="admin@example.com", role="admin")
-        admin_user.set_password("testpassword")
-        admin_user.save()
-
+        admin_user = User(
+            username="testadmin",
+            email="admin@example.com",
+            role="admin",
+            password_hash=test_password_hash,
+        )
         regular_user = User(
-            username="testuser", email="user@example.com", role="member"
+            username="testuser",
+            email="user@example.com",
+            role="member",
+            password_hash=test_password_hash,
         )
-        regular_user.set_password("testpassword")
-        regular_user.save()
+        # One bulk insert; the documents get their ids assigned in place.
+        User.objects.insert([admin_user, regular_user], load_bulk=False)
         yield admin_user, regular_user
 
 
 @pytest.fixture(autouse=True)
-def clean_collections_per_function(app):
-    """Cleans up specific collections after each test function."""
-    # For host-side E2E runs we skip DB entirely.
-    if os.environ.get("SKIP_DB_CHECK") == "1":
+def clean_collections_per_function(request):
+    """Cleans up specific collections after each test that uses the app."""
+    # For host-side E2E runs we skip DB entirely. Tests that never touch the
+    # app (pure unit tests) should not force the session app to be built.
+    if (
+        os.environ.get("SKIP_DB_CHECK") == "1"
+        or "app" not in request.fixturenames
+    ):
         yield
         return
+    app = request.getfixturevalue("app")
     yield
-    if app is None:
-        return
     with app.app_context():
         try:
-            # Explicitly drop collections that are modified by tests
-            _clear_test_collections()
+            # Empty only the collections this test wrote to
+            _clear_test_collections(only_dirty=True)
             # Add other collections here if they are modified by tests
         except ServerSelectionTimeoutError:
             pass
 
 
+def _login_cookie(client, name, path_config_key):
+    """Read a JWT cookie from the test client's jar after a login."""
+    path = client.application.config[path_config_key]
+    cookie = client.get_cookie(name, path=path)
+    if cookie is None:
+        raise Exception(f"{name} not found in the client cookie jar")
+    return cookie.value
+
+
 @pytest.fixture
 def login_user_fixture(client):
     def _login_user(username, password):
@@ -255,13 +354,7 @@ def login_user_fixture(client):
             "/api/auth/login", json={"username": username, "password": password}
         )
         assert response.status_code == 200
-
-        # Extract access token from Set-Cookie header
-        for cookie_header in response.headers.getlist("Set-Cookie"):
-            match = re.search(r"access_token_cookie=([^;]+)", cookie_header)
-            if match:
-                return match.group(1)
-        raise Exception("Access token cookie not found in response headers")
+        return _login_cookie(client, "access_token_cookie", "JWT_ACCESS_COOKIE_PATH")
 
     return _login_user
 
@@ -273,13 +366,9 @@ def get_refresh_token_fixture(client):
             "/api/auth/login", json={"username": username, "password": password}
         )
         assert response.status_code == 200
-
-        # Extract refresh token from Set-Cookie header
-        for cookie_header in response.headers.getlist("Set-Cookie"):
-            match = re.search(r"refresh_token_cookie=([^;]+)", cookie_header)
-            if match:
-                return match.group(1)
-        raise Exception("Refresh token cookie not found in response headers")
+        return _login_cookie(
+            client, "refresh_token_cookie", "JWT_REFRESH_COOKIE_PATH"
+        )
 
     return _get_refresh_token
 
@@ -14,12 +14,9 @@ class TestDatabaseChaos:
         """
         G4.1: If MongoDB is unreachable during a blog listing, the API must return 503.
         """
-        # Patch Article.objects (the attribute) to return a mock that simulates the QuerySet chain.
-        with patch("src.models.article.Article.objects") as mocked_queryset:
-            # The repository calls: Article.objects(is_published=True).only(...).order_by(...).paginate(...)
-            # So Article.objects (the mock) when called returns another mock (the chain).
-            mock_chain = mocked_queryset.return_value
-            mock_chain.only.return_value.order_by.return_value.paginate.side_effect = (
+        # The public listing reads the raw PyMongo collection, so fail it there.
+        with patch("src.models.article.Article._get_collection") as mocked_collection:
+            mocked_collection.return_value.count_documents.side_effect = (
                 ConnectionFailure("Simulated MongoDB failure")
             )
 
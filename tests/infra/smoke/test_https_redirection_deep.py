@@ -1,6 +1,9 @@
 import pytest
 import os
 
+# The session app fixture passes its key as an override rather than via env.
+_TEST_SECRET_KEY = "test-secret-key-32-bytes-min-length-012345"
+
 @pytest.mark.integration
 class TestHttpsRedirectionDeep:
     """
@@ -16,7 +19,7 @@ class TestHttpsRedirectionDeep:
         
         # We manually create a fresh app and client to ensure it picks up the env
         from src.server import create_app
-        app = create_app()
+        app = create_app(config_overrides={"SECRET_KEY": _TEST_SECRET_KEY})
         app.config["TESTING"] = True
         client = app.test_client()
         
@@ -34,7 +37,7 @@ class TestHttpsRedirectionDeep:
         monkeypatch.setenv("TALISMAN_FORCE_HTTPS", "true")
         
         from src.server import create_app
-        app = create_app()
+        app = create_app(config_overrides={"SECRET_KEY": _TEST_SECRET_KEY})
         app.config["TESTING"] = True
         client = app.test_client()
         
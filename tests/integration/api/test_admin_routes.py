@@ -6,28 +6,53 @@ import datetime
 
 
 @pytest.fixture
-def test_admin_user(app):
+def test_admin_user(app, password_hash_for):
     with app.app_context():
         admin_user = User(username="adminuser", email="admin@example.com", role="admin")
-        admin_user.set_password("AdminPassword123")
+        admin_user.password_hash = password_hash_for("AdminPassword123")
         admin_user.save()
         yield admin_user
         admin_user.delete()
 
 
 @pytest.fixture
-def admin_headers(login_user_fixture, test_admin_user):
-    token = login_user_fixture("adminuser", "AdminPassword123")
+def admin_headers(app, test_admin_user):
+    """Mint an admin access token directly; the login flow is covered elsewhere."""
+    from src.services import get_auth_service
+
+    token = create_access_token(
+        identity=str(test_admin_user.id),
+        additional_claims=get_auth_service().build_token_claims(test_admin_user),
+    )
     return {"Authorization": f"Bearer {token}"}
 
 
 class TestAdminArticleRoutes:
     """Tests for admin article management routes."""
 
-    def test_get_article_with_invalid_id_format(self, client, admin_headers):
-        invalid_id = "not-a-valid-objectid"
-        response = client.get(
-            f"/api/content/articles/{invalid_id}", headers=admin_headers
+    @pytest.mark.parametrize(
+        "method,invalid_id",
+        [
+            ("GET", "not-a-valid-objectid"),
+            ("PUT", "another-invalid-id"),
+            ("DELETE", "yet-another-invalid-id"),
+            ("GET", '{"$ne":null}'),
+        ],
+    )
+    def test_article_routes_reject_invalid_id_format(
+        self, client, admin_headers, method, invalid_id
+    ):
+        payload = {
+            "title": "Irrelevant",
+            "content": "Irrelevant.",
+            "summary": "Irrelevant.",
+            "is_published": False,
+        }
+        response = client.open(
+            f"/api/content/articles/{invalid_id}",
+            method=method,
+            headers=admin_headers,
+            json=payload if method == "PUT" else None,
         )
         assert response.status_code == 400
         assert response.json["error_code"] == "BAD_REQUEST"
@@ -3,11 +3,14 @@ import pytest
 from src.models.article import Article
 from src.models.user import User
 
+# Fixed so fixtures are deterministic for any date-based logic.
+_PUBLICATION_DATE = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
 
 @pytest.fixture
-def contract_user(app):
+def contract_user(app, password_hash_for):
     user = User(username="contractuser", email="contract@example.com", role="member")
-    user.set_password("Password123!")
+    user.password_hash = password_hash_for("Password123!")
     user.save()
     yield user
     user.delete()
@@ -22,7 +25,7 @@ def contract_article(app, contract_user):
         summary="Contract summary",
         author=contract_user,
         is_published=True,
-        publication_date=datetime.datetime.now(datetime.timezone.utc),
+        publication_date=_PUBLICATION_DATE,
     ).save()
     yield art
     art.delete()
@@ -3,12 +3,6 @@ from src.models.article import Article
 
 
 class TestApiRoutes:
-    def test_home_api_returns_expected_structure(self, client):
-        response = client.get("/api/home")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert "title" in data
-
     def test_blog_list_api_successful(self, app, client):
         with app.app_context():
             from src.models.user import User
@@ -59,3 +53,30 @@ class TestApiRoutes:
         response = client.get("/api/blog/detail-article")
         assert response.status_code == 200
         assert response.get_json()["title"] == "Detail Article"
+
+    def test_blog_article_api_honours_etag(self, app, client):
+        with app.app_context():
+            from src.models.user import User
+
+            author = User(username="etag_author", email="etag@test.com", role="admin")
+            author.set_password("password")
+            author.save()
+            Article(
+                title="Etag Article",
+                slug="etag-article",
+                content="Content",
+                summary="Summary",
+                author=author,
+                is_published=True,
+            ).save()
+
+        first = client.get("/api/blog/etag-article")
+        assert first.status_code == 200
+        etag = first.headers.get("ETag")
+        assert etag
+
+        revalidated = client.get(
+            "/api/blog/etag-article", headers={"If-None-Match": etag}
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.data == b""
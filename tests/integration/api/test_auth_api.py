@@ -3,10 +3,10 @@ from src.models.user import User
 
 
 @pytest.fixture
-def test_user(app):
+def test_user(app, password_hash_for):
     with app.app_context():
         user = User(username="testuser", email="test@example.com", role="member")
-        user.set_password("testpassword")
+        user.password_hash = password_hash_for("testpassword")
         user.save()
         yield user
         user.delete()
@@ -47,7 +47,7 @@ def test_login_requires_turnstile_when_enabled(client, test_user, monkeypatch):
         def verify_token(self, token, remote_ip=None):
             return False
 
-    monkeypatch.setenv("TURNSTILE_LOGIN_ENABLED", "true")
+    monkeypatch.setitem(client.application.config, "TURNSTILE_LOGIN_ENABLED", True)
     monkeypatch.setattr(auth_routes, "turnstile_service", _DummyTurnstile())
 
     response = client.post(
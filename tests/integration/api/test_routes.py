@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 
 def test_home_api_returns_json(client):
     """Verifies the main public API endpoint (/api/home) is working."""
@@ -30,6 +32,36 @@ def test_blog_Article_not_found_returns_404(client):
     assert data["message"] == "Article not found"
 
 
+@pytest.mark.parametrize(
+    "slug", ["invalid!slug@", "{'$ne': 'x'}", "{'$gt': ''}", "Upper-Case"]
+)
+def test_blog_post_api_rejects_bad_slug(client, slug):
+    """Malformed or operator-shaped slugs are rejected before any lookup."""
+    response = client.get(f"/api/blog/{slug}")
+    assert response.status_code == 400
+    data = response.get_json()
+    assert data["error_code"] == "BAD_REQUEST"
+    assert data["message"] == "Invalid slug format."
+
+
+@pytest.mark.parametrize(
+    "query_string,expected_msg",
+    [
+        ("page=abc", "Invalid page or per_page parameter. Must be integers."),
+        ("per_page=xyz", "Invalid page or per_page parameter. Must be integers."),
+        ("page=0", "Page and per_page must be positive integers."),
+        ("per_page=-1", "Page and per_page must be positive integers."),
+    ],
+)
+def test_blog_list_api_rejects_bad_pagination(client, query_string, expected_msg):
+    """Non-integer or non-positive pagination parameters return 400."""
+    response = client.get(f"/api/blog?{query_string}")
+    assert response.status_code == 400
+    data = response.get_json()
+    assert data["error_code"] == "BAD_REQUEST"
+    assert data["message"] == expected_msg
+
+
 def test_admin_route_is_unauthorized_without_login(client):
     """Ensures the admin API endpoints are properly protected."""
     response = client.get("/api/content/articles")
@@ -56,25 +88,18 @@ def test_change_password_route_is_unauthorized_without_login(client):
 # --- New Path-based Routing "Gate" Tests ---
 
 
-def test_root_returns_spa_shell(client):
-    """Verifies the root returns the SPA shell (base.html)."""
-    response = client.get("/")
-    assert response.status_code == 200
-    assert b"<!DOCTYPE html>" in response.data
-    assert b'id="main-content"' in response.data
-
-
-def test_catch_all_returns_spa_shell(client):
-    """Verifies any non-API path returns the SPA shell (History API Support)."""
-    # This should return base.html, NOT a 404.
-    response = client.get("/admin/profile")
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/",
+        # History API support: non-API paths return base.html, NOT a 404.
+        "/admin/profile",
+        "/blog/my-test-article",
+    ],
+)
+def test_non_api_paths_return_spa_shell(client, path):
+    """Verifies the root and any non-API path return the SPA shell (base.html)."""
+    response = client.get(path)
     assert response.status_code == 200
     assert b"<!DOCTYPE html>" in response.data
     assert b'id="main-content"' in response.data
-
-
-def test_catch_all_blog_returns_spa_shell(client):
-    """Verifies blog slugs return the SPA shell."""
-    response = client.get("/blog/my-test-article")
-    assert response.status_code == 200
-    assert b"<!DOCTYPE html>" in response.data
@@ -6,10 +6,10 @@ from src.events import article_created, article_deleted
 from src.schemas import ArticlePublic
 
 @pytest.fixture
-def test_admin_user(app):
+def test_admin_user(app, password_hash_for):
     with app.app_context():
         admin_user = User(username="adminuser", email="admin@example.com", role="admin")
-        admin_user.set_password("AdminPassword123")
+        admin_user.password_hash = password_hash_for("AdminPassword123")
         admin_user.save()
         yield admin_user
         admin_user.delete()
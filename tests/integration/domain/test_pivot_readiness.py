@@ -31,8 +31,13 @@ class TestPivotReadiness:
             art = article_service.create_article(article_dto=dto, user=user_identity)
             article_id = str(art.id)
 
-            for i in range(3):
-                Comment(content=f"Comment {i}", author=author, article=art).save()
+            Comment.objects.insert(
+                [
+                    Comment(content=f"Comment {i}", author=author, article=art)
+                    for i in range(3)
+                ],
+                load_bulk=False,
+            )
 
             assert Comment.objects(article=article_id).count() == 3
 
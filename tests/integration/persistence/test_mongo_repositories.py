@@ -8,6 +8,9 @@ from src.models.user import User
 from src.repositories.mongo_article_repository import MongoArticleRepository
 from src.repositories.mongo_user_repository import MongoUserRepository
 
+# Fixed so fixtures are deterministic for any date-based logic.
+_PUBLICATION_DATE = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
 
 def test_user_repository_lookup_by_username_and_id(app):
     user_repository = MongoUserRepository()
@@ -46,7 +49,7 @@ def test_article_repository_published_pagination_and_slug_helpers(app):
             summary="Published summary",
             author=author,
             is_published=True,
-            publication_date=datetime.datetime.now(datetime.timezone.utc),
+            publication_date=_PUBLICATION_DATE,
         )
         article_repository.save(published_art)
 
@@ -63,7 +66,7 @@ def test_article_repository_published_pagination_and_slug_helpers(app):
         paginated = article_repository.get_published_paginated(page=1, per_page=10)
         assert paginated.total == 1
         assert len(paginated.items) == 1
-        assert paginated.items[0].slug == "repository-published-article"
+        assert paginated.items[0]["slug"] == "repository-published-article"
 
         found_art = article_repository.get_by_slug("repository-published-article")
         assert found_art is not None
@@ -5,16 +5,16 @@ from src.models.comment import Comment
 from src.repositories import get_comment_repository
 
 @pytest.fixture
-def test_data(app):
+def test_data(app, password_hash_for):
     with app.app_context():
         # Create author
         author = User(username="cleanupauthor", email="cleanup@example.com", role="member")
-        author.set_password("testpassword")
+        author.password_hash = password_hash_for("testpassword")
         author.save()
         
         # Create another user for article author
         admin = User(username="cleanupadmin", email="admin-cleanup@example.com", role="admin")
-        admin.set_password("testpassword")
+        admin.password_hash = password_hash_for("testpassword")
         admin.save()
         
         # Create article
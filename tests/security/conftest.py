@@ -1,4 +1,7 @@
+import datetime
+
 import pytest
+from bson import ObjectId
 from flask_jwt_extended import create_access_token
 
 from src.models.user import User
@@ -7,44 +10,44 @@ from src.services.auth_service import AuthService
 
 
 @pytest.fixture
-def admin_user(client):
+def admin_user(client, password_hash_for):
     """Create and return an admin user."""
     user = User(username="testadmin", email="admin@test.com", role="admin")
-    user.set_password("password")
+    user.password_hash = password_hash_for("password")
     user.save()
     yield user
     user.delete()
 
 
 @pytest.fixture
-def regular_user(client):
+def regular_user(client, password_hash_for):
     """Create and return a regular user (Member)."""
     user = User(username="testuser", email="user@test.com", role="member")
-    user.set_password("password")
+    user.password_hash = password_hash_for("password")
     user.save()
     yield user
     user.delete()
 
 
 @pytest.fixture
-def content_admin_user(client):
+def content_admin_user(client, password_hash_for):
     """Create and return a content-focused user (Author)."""
     user = User(
         username="contentauthor",
         email="author@test.com",
         role="author",
     )
-    user.set_password("password")
+    user.password_hash = password_hash_for("password")
     user.save()
     yield user
     user.delete()
 
 
 @pytest.fixture
-def ops_admin_user(client):
+def ops_admin_user(client, password_hash_for):
     """Create and return a user who used to be ops admin (now Member)."""
     user = User(username="opsuser", email="opsuser@test.com", role="member")
-    user.set_password("password")
+    user.password_hash = password_hash_for("password")
     user.save()
     yield user
     user.delete()
@@ -91,16 +94,23 @@ def content_admin_headers(app, content_admin_user):
 
 @pytest.fixture
 def admin_article(app, admin_user):
+    """Insert a draft article directly, skipping document validation on save."""
     from src.models.article import Article
 
     with app.app_context():
-        art = Article(
-            title="Admin Draft",
-            slug="admin-draft",
-            content="Content.",
-            summary="Summary.",
-            author=admin_user,
-            is_published=False,
-        ).save()
-        yield art
-        art.delete()
+        article_id = ObjectId()
+        collection = Article._get_collection()
+        collection.insert_one(
+            {
+                "_id": article_id,
+                "title": "Admin Draft",
+                "slug": "admin-draft",
+                "content": "Content.",
+                "summary": "Summary.",
+                "author": admin_user.id,
+                "is_published": False,
+                "last_updated": datetime.datetime.now(datetime.timezone.utc),
+            }
+        )
+        yield Article.objects.get(id=article_id)
+        collection.delete_one({"_id": article_id})
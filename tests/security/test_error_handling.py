@@ -1,6 +1,5 @@
-import pytest
 from unittest.mock import patch
-from src.models.article import Article
+from src.services import get_article_service
 
 
 class TestErrorHandlingAndLogging:
@@ -8,28 +7,22 @@ class TestErrorHandlingAndLogging:
     Tests that the application handles errors gracefully.
     """
 
-    def test_500_error_returns_json(self, client, admin_headers):
+    def test_500_error_response_shape(self, client, admin_headers):
         """
-        Verify that a 500 error returns a structured JSON response.
+        Verify that a 500 error returns a structured JSON response without
+        stack trace info.
         """
-        with patch("src.models.article.Article.objects") as mocked_objects:
-            mocked_objects.side_effect = Exception("Simulating a database error")
-
-            response = client.get("/api/content/articles", headers=admin_headers)
-
-            assert response.status_code == 500
-            data = response.get_json()
-            assert data["error_code"] == "INTERNAL_SERVER_ERROR"
-
-    def test_no_stack_trace_in_500_response(self, client, admin_headers):
-        """
-        Ensure that the 500 error response does not contain stack trace info.
-        """
-        with patch("src.models.article.Article.objects") as mocked_objects:
-            mocked_objects.side_effect = Exception("Simulating a database error")
-
+        # Fail at the service singleton the routes hold, leaving MongoEngine's
+        # Article.objects descriptor untouched.
+        with patch.object(
+            get_article_service(),
+            "list_admin_articles",
+            side_effect=Exception("Simulating a database error"),
+        ):
             response = client.get("/api/content/articles", headers=admin_headers)
 
-            assert response.status_code == 500
-            response_text = response.get_data(as_text=True)
-            assert "Traceback" not in response_text
+        assert response.status_code == 500
+        assert response.content_type == "application/json"
+        data = response.get_json()
+        assert data["error_code"] == "INTERNAL_SERVER_ERROR"
+        assert "Traceback" not in response.get_data(as_text=True)
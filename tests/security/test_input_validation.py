@@ -7,16 +7,17 @@ class TestInputValidation:
             "/api/content/articles", headers=admin_headers, json=payload
         )
         assert response.status_code == 400
-        assert response.json["error_code"] == "BAD_REQUEST"
-        assert response.json["message"] == "Invalid data"
-        assert isinstance(response.json["details"], list)
+        data = response.get_json()
+        assert data["error_code"] == "BAD_REQUEST"
+        assert data["message"] == "Invalid data"
+        assert isinstance(data["details"], list)
         assert any(
             err["loc"] == ["summary"] and err["msg"] == "Field required"
-            for err in response.json["details"]
+            for err in data["details"]
         )
         assert any(
             err["loc"] == ["content"] and err["msg"] == "Field required"
-            for err in response.json["details"]
+            for err in data["details"]
         )
 
     def test_create_Article_oversized_title(self, client, admin_headers):
@@ -29,12 +30,13 @@ class TestInputValidation:
             "/api/content/articles", headers=admin_headers, json=payload
         )
         assert response.status_code == 400
-        assert response.json["error_code"] == "BAD_REQUEST"
-        assert response.json["message"] == "Invalid data"
-        assert isinstance(response.json["details"], list)
+        data = response.get_json()
+        assert data["error_code"] == "BAD_REQUEST"
+        assert data["message"] == "Invalid data"
+        assert isinstance(data["details"], list)
         assert any(
             err["loc"] == ["title"] and "at most 200 characters" in err["msg"]
-            for err in response.json["details"]
+            for err in data["details"]
         )
 
     def test_create_Article_xss_payload(self, client, admin_headers):
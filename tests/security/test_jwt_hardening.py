@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
-from flask_jwt_extended import create_access_token, decode_token
+import jwt
+from flask_jwt_extended import create_access_token
 from src.services import get_auth_service
 
 
@@ -8,12 +9,11 @@ class TestJWTAuthentication:
     """Tests for JWT authentication hardening."""
 
     def test_access_token_expiry(self, client, admin_user):
-        with client.application.app_context():
-            access_token = create_access_token(
-                identity=str(admin_user.id),
-                additional_claims={"roles": ["admin"], "tv": admin_user.token_version},
-                expires_delta=timedelta(seconds=-1),
-            )
+        access_token = create_access_token(
+            identity=str(admin_user.id),
+            additional_claims={"roles": ["admin"], "tv": admin_user.token_version},
+            expires_delta=timedelta(seconds=-1),
+        )
         headers = {"Authorization": f"Bearer {access_token}"}
         response = client.get("/api/content/articles", headers=headers)
         assert response.status_code == 401
@@ -33,7 +33,9 @@ class TestJWTAuthentication:
                 identity=str(admin_user.id),
                 additional_claims={"roles": ["admin"], "tv": admin_user.token_version},
             )
-            decoded_token = decode_token(access_token)
+            decoded_token = jwt.decode(
+                access_token, options={"verify_signature": False}
+            )
             jti = decoded_token["jti"]
             expires = datetime.fromtimestamp(decoded_token["exp"], tz=timezone.utc)
 
@@ -49,11 +51,10 @@ class TestJWTAuthentication:
         assert data["message"] == "Token has been revoked."
 
     def test_admin_required_with_missing_roles_claim(self, client, app, regular_user):
-        with app.app_context():
-            access_token = create_access_token(
-                identity=str(regular_user.id),
-                additional_claims={"tv": regular_user.token_version},
-            )
+        access_token = create_access_token(
+            identity=str(regular_user.id),
+            additional_claims={"tv": regular_user.token_version},
+        )
         headers = {"Authorization": f"Bearer {access_token}"}
         response = client.get("/api/content/articles", headers=headers)
         assert response.status_code == 403
@@ -63,11 +64,10 @@ class TestJWTAuthentication:
         )
 
     def test_admin_required_with_non_list_roles_claim(self, client, app, regular_user):
-        with app.app_context():
-            access_token = create_access_token(
-                identity=str(regular_user.id),
-                additional_claims={"roles": "user", "tv": regular_user.token_version},
-            )
+        access_token = create_access_token(
+            identity=str(regular_user.id),
+            additional_claims={"roles": "user", "tv": regular_user.token_version},
+        )
         headers = {"Authorization": f"Bearer {access_token}"}
         response = client.get("/api/content/articles", headers=headers)
         assert response.status_code == 403
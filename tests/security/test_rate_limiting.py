@@ -1,28 +1,7 @@
 import pytest
-from flask import json
-from src.server import create_app  # Import create_app from the actual application
-from src.extensions import limiter  # Import the limiter instance
-import time
-
-# Use the main app fixture from conftest.py
-# @pytest.fixture(scope='function') # This fixture is no longer needed
-# def app_with_rate_limit():
-#     app = create_app()
-#     app.config.update({
-#         'TESTING': True,
-#         'RATELIMIT_STORAGE_URL': 'memory://', # Use in-memory storage for testing
-#         'RATELIMIT_STRATEGY': 'fixed-window'
-#     })
-#     @app.route('/test-rate-limit')
-#     def test_rate_limit_route():
-#         return "OK"
-#     yield app
-
-# @pytest.fixture() # This fixture is no longer needed
-# def client_with_rate_limit(app_with_rate_limit):
-#     return app_with_rate_limit.test_client()
 
 
+@pytest.mark.ratelimit
 class TestRateLimiting:
     """Tests for Rate Limiting & Abuse Control."""
 
@@ -41,11 +20,12 @@ class TestRateLimiting:
 
     def test_rate_limit_blocks_requests_beyond_limit(self, client):
         """Test that requests beyond the rate limit are blocked (429) for /api/auth/login."""
-        # Current limit is 20 per minute for testing/E2E stability
+        # Current limit is 20 per minute for testing/E2E stability. Every
+        # request counts against it, so fill the window with empty bodies that
+        # are rejected before any user lookup or password check.
         for _ in range(20):
-            client.post(
-                "/api/auth/login", json={"username": "test", "password": "password"}
-            )
+            response = client.post("/api/auth/login", json={})
+            assert response.status_code == 400
 
         # The 21st request should be blocked
         response = client.post(
@@ -78,16 +58,18 @@ class TestRateLimiting:
 
     def test_rate_limit_per_user_or_ip(self, client):
         """Test rate limiting based on user identity or IP address."""
-        # Simulate requests from two different IP addresses
-        ip1_headers = {"X-Forwarded-For": "192.168.1.1"}
-        ip2_headers = {"X-Forwarded-For": "192.168.1.2"}
+        # Simulate requests from two different IP addresses. Set the remote
+        # address the limiter keys on directly rather than X-Forwarded-For,
+        # which only counts when the app was built with ProxyFix applied.
+        ip1_environ = {"REMOTE_ADDR": "192.168.1.1"}
+        ip2_environ = {"REMOTE_ADDR": "192.168.1.2"}
 
         # IP 1 makes requests within its limit
         for _ in range(5):
             response = client.post(
                 "/api/contact",
                 json={"name": "test", "email": "test1@example.com", "message": "hello", "turnstile_token": "dummy"},
-                headers=ip1_headers,
+                environ_base=ip1_environ,
             )
             assert response.status_code == 200
 
@@ -95,7 +77,7 @@ class TestRateLimiting:
         response = client.post(
             "/api/contact",
             json={"name": "test", "email": "test1@example.com", "message": "hello"},
-            headers=ip1_headers,
+            environ_base=ip1_environ,
         )
         assert response.status_code == 429
         data = response.get_json()
@@ -107,7 +89,7 @@ class TestRateLimiting:
             response = client.post(
                 "/api/contact",
                 json={"name": "test", "email": "test2@example.com", "message": "hello", "turnstile_token": "dummy"},
-                headers=ip2_headers,
+                environ_base=ip2_environ,
             )
             assert response.status_code == 200
 
@@ -115,7 +97,7 @@ class TestRateLimiting:
         response = client.post(
             "/api/contact",
             json={"name": "test", "email": "test2@example.com", "message": "hello"},
-            headers=ip2_headers,
+            environ_base=ip2_environ,
         )
         assert response.status_code == 429
         data = response.get_json()
@@ -1,22 +1,3 @@
-import pytest
-from src.models.article import Article
-
-
-@pytest.fixture
-def admin_article(app, admin_user):
-    with app.app_context():
-        art = Article(
-            title="Admin Draft",
-            slug="admin-draft",
-            content="Content.",
-            summary="Summary.",
-            author=admin_user,
-            is_published=False,
-        ).save()
-        yield art
-        art.delete()
-
-
 class TestRBAC:
     def test_admin_can_access_content_management(self, client, admin_headers):
         response = client.get("/api/content/articles", headers=admin_headers)
@@ -6,6 +6,7 @@ def test_security_headers_present(client):
     assert "Content-Security-Policy" in response.headers
     assert "Referrer-Policy" in response.headers
     assert "Permissions-Policy" in response.headers
+    assert "geolocation=()" in response.headers["Permissions-Policy"]
     
     # HSTS is only added by Talisman when FLASK_ENV is production
     if os.environ.get("FLASK_ENV") == "production":
@@ -1,15 +1,15 @@
 import pytest
 from src.models.user import User
-from flask_jwt_extended import decode_token
+import jwt
 import datetime
 from src.services.auth_service import AuthService
 from src.repositories.mongo_user_repository import MongoUserRepository
 
 
 @pytest.fixture
-def test_admin_user(app):
+def test_admin_user(app, password_hash_for):
     admin_user = User(username="adminuser", email="admin@example.com", role="admin")
-    admin_user.set_password("AdminPassword123")
+    admin_user.password_hash = password_hash_for("AdminPassword123")
     admin_user.save()
     yield admin_user
     admin_user.delete()
@@ -38,7 +38,7 @@ def test_admin_access_after_user_deletion(
     assert User.objects(username="adminuser").first() is None
 
     # Explicitly blacklist the admin_token
-    decoded_token = decode_token(admin_token)
+    decoded_token = jwt.decode(admin_token, options={"verify_signature": False})
     jti = decoded_token["jti"]
     expires = datetime.datetime.fromtimestamp(
         decoded_token["exp"], datetime.timezone.utc
@@ -66,7 +66,9 @@ def test_blacklisted_refresh_token_rejected(
 
     # 2. Blacklist the refresh token
     with app.app_context():
-        decoded_token = decode_token(refresh_token)
+        decoded_token = jwt.decode(
+            refresh_token, options={"verify_signature": False}
+        )
         jti = decoded_token["jti"]
         expires = datetime.datetime.fromtimestamp(
             decoded_token["exp"], datetime.timezone.utc
@@ -87,7 +89,9 @@ def test_blacklisted_refresh_token_rejected(
     assert data["message"] == "Token has been revoked."
 
 
-def test_access_token_invalidated_after_role_change(client, app, login_user_fixture):
+def test_access_token_invalidated_after_role_change(
+    client, app, login_user_fixture, password_hash_for
+):
     """
     Tests that an existing access token is rejected after role change increments
     the user's token_version in persistence.
@@ -95,7 +99,7 @@ def test_access_token_invalidated_after_role_change(client, app, login_user_fixt
     user = User(
         username="rolechangeuser", email="rolechange@example.com", role="member"
     )
-    user.set_password("RoleChangePass123")
+    user.password_hash = password_hash_for("RoleChangePass123")
     user.save()
 
     access_token = login_user_fixture("rolechangeuser", "RoleChangePass123")
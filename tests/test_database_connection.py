@@ -4,16 +4,17 @@ from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from mongoengine import get_db
 import logging
 import os  # Added os import
+from src.extensions import db as test_db_extension, limiter as test_limiter_extension
 from src.utils.db_utils import check_db_connection
-from src.server import create_app  # Keep this import for the log check
 
 
-def test_database_connection(caplog, monkeypatch):  # Removed 'app' fixture
+def test_database_connection(caplog):  # Removed 'app' fixture
     """
     Tests the database connection, providing specific feedback.
     """
-    # Create a dedicated app instance for this test to control its DB settings
-    test_app = Flask(__name__)
+    # Host-side E2E runs have no database; don't spend the probe timeouts.
+    if os.environ.get("SKIP_DB_CHECK") == "1":
+        pytest.skip("Database checks disabled (SKIP_DB_CHECK=1).")
 
     def try_connect(uri_label: str, uri: str):
         temp_app = Flask(__name__)
@@ -26,11 +27,6 @@ def test_database_connection(caplog, monkeypatch):  # Removed 'app' fixture
         temp_app.config["RATELIMIT_STORAGE_URI"] = os.environ.get(
             "RATELIMIT_STORAGE_URI", "redis://redis:6379/0"
         )
-        from src.extensions import (
-            db as test_db_extension,
-            limiter as test_limiter_extension,
-        )
-
         test_db_extension.init_app(temp_app)
         test_limiter_extension.init_app(temp_app)
 
@@ -88,13 +84,10 @@ def test_database_connection(caplog, monkeypatch):  # Removed 'app' fixture
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
             pytest.fail(f"Could not list databases: {e}")
 
-        # 3. Was the database connected when the web app started?
-        # This part still needs to create the main app to check its logs
-        with caplog.at_level(logging.INFO):
-            # Ensure create_app uses the same resolved URI
-            monkeypatch.setenv("MONGO_URI", mongo_host)
-            app_instance = create_app()  # Create the actual app to check its logs
-            pass  # No explicit call needed here, just let create_app run
+    # 3. Does the startup probe report success? create_app() runs this same
+    # check_db_connection call, so exercise it on the connected app directly.
+    with caplog.at_level(logging.INFO):
+        assert check_db_connection(test_app)
 
-        assert "Database connection successful." in caplog.text
-        print("Database connection was successful at startup.")
+    assert "Database connection successful." in caplog.text
+    print("Database connection was successful at startup.")
@@ -0,0 +1,18 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.exceptions import BadRequestException
+from src.services.article_service import ArticleService
+
+
+@pytest.mark.parametrize(
+    "article_id", ["not-a-valid-objectid", '{"$ne": null}', "0" * 23, "g" * 24]
+)
+def test_malformed_article_id_rejected_before_repository(article_id):
+    article_repo = MagicMock()
+    service = ArticleService(article_repo, MagicMock())
+
+    with pytest.raises(BadRequestException):
+        service.get_article_or_404(article_id)
+    article_repo.get_by_id.assert_not_called()
@@ -78,3 +78,53 @@ def test_delete_account_invalid_password(auth_service):
         # Act & Assert
         with pytest.raises(UnauthorizedException, match="Invalid current password"):
             auth_service.delete_account(user_id=user_id, current_password=current_password)
+
+def test_revoked_jti_is_served_from_local_cache(mock_user_repo, mock_token_repo):
+    from src.utils.ttl_cache import TTLCache
+
+    service = AuthService(
+        user_repository=mock_user_repo,
+        token_repository=mock_token_repo,
+        revoked_cache=TTLCache(maxsize=16, ttl=60),
+    )
+    service.revoke_token("revoked-jti", MagicMock())
+
+    assert service.is_token_revoked({"jti": "revoked-jti", "sub": "user123"})
+    mock_token_repo.is_jti_revoked.assert_not_called()
+
+def test_unrevoked_jti_is_never_cached(mock_user_repo, mock_token_repo):
+    from src.utils.ttl_cache import TTLCache
+
+    service = AuthService(
+        user_repository=mock_user_repo,
+        token_repository=mock_token_repo,
+        revoked_cache=TTLCache(maxsize=16, ttl=60),
+    )
+    mock_token_repo.is_jti_revoked.return_value = False
+    mock_user_repo.get_by_id.return_value = None
+
+    service.is_token_revoked({"jti": "live-jti", "sub": "user123"})
+    service.is_token_revoked({"jti": "live-jti", "sub": "user123"})
+
+    assert mock_token_repo.is_jti_revoked.call_count == 2
+
+
+def test_unrevoked_cache_skips_blocklist_until_revoked(mock_user_repo, mock_token_repo):
+    from src.utils.ttl_cache import TTLCache
+
+    service = AuthService(
+        user_repository=mock_user_repo,
+        token_repository=mock_token_repo,
+        unrevoked_cache=TTLCache(maxsize=16, ttl=60),
+    )
+    mock_token_repo.is_jti_revoked.return_value = False
+    mock_user_repo.get_by_id.return_value = None
+
+    service.is_token_revoked({"jti": "live-jti", "sub": "user123"})
+    service.is_token_revoked({"jti": "live-jti", "sub": "user123"})
+    assert mock_token_repo.is_jti_revoked.call_count == 1
+
+    service.revoke_token("live-jti", MagicMock())
+    mock_token_repo.is_jti_revoked.return_value = True
+    assert service.is_token_revoked({"jti": "live-jti", "sub": "user123"})
+    assert mock_token_repo.is_jti_revoked.call_count == 2
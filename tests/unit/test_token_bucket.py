@@ -0,0 +1,19 @@
+from unittest.mock import patch
+
+from src.utils.token_bucket import TokenBucket
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    with patch("src.utils.token_bucket.time.monotonic", return_value=0.0):
+        bucket = TokenBucket(capacity=3, rate=1)
+        assert [bucket.consume() for _ in range(4)] == [True, True, True, False]
+
+
+def test_token_bucket_refills_over_time():
+    with patch("src.utils.token_bucket.time.monotonic", return_value=0.0):
+        bucket = TokenBucket(capacity=1, rate=1)
+        assert bucket.consume()
+        assert not bucket.consume()
+
+    with patch("src.utils.token_bucket.time.monotonic", return_value=1.5):
+        assert bucket.consume()
@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+from src.services.article_service import ArticleService
+from src.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_returns_value_until_expiry():
+    cache = TTLCache(maxsize=4, ttl=10)
+
+    with patch("src.utils.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+    with patch("src.utils.ttl_cache.time.monotonic", return_value=111.0):
+        assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_disabled_with_zero_ttl():
+    cache = TTLCache(maxsize=10, ttl=0)
+    cache.set("key", "value")
+
+    assert not cache.enabled
+    assert cache.get("key", "default") == "default"
+
+
+def test_article_service_caches_public_article_until_cleared():
+    article_repo = MagicMock()
+    service = ArticleService(
+        article_repo, MagicMock(), public_cache=TTLCache(maxsize=8, ttl=60)
+    )
+
+    with patch.object(service, "to_public_dict", return_value={"slug": "a"}):
+        assert service.get_public_article("a") == {"slug": "a"}
+        assert service.get_public_article("a") == {"slug": "a"}
+        assert article_repo.get_by_slug.call_count == 1
+
+        service.clear_public_cache()
+        service.get_public_article("a")
+        assert article_repo.get_by_slug.call_count == 2